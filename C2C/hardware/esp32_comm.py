@@ -19,14 +19,19 @@ CONTROL LAYERS:
 
 import serial
 import serial.tools.list_ports
+import atexit
 import threading
 import queue
 import time
+import logging
+import itertools
+from collections import deque
 
 # Import new control layers
 from .serial_link import ESP32Serial
 from .motion_queue import MotionQueue
 from .watchdog import Watchdog, WatchdogTimeout
+logger = logging.getLogger(__name__)
 
 
 class ESP32Communicator:
@@ -41,7 +46,10 @@ class ESP32Communicator:
     This provides industrial-grade deterministic control.
     """
     
-    def __init__(self, port=None, baudrate=115200, enable_watchdog=True):
+    # Longest the update worker sleeps with nothing to do (watchdog cadence)
+    WORKER_IDLE_TIMEOUT = 0.2
+    
+    def __init__(self, port=None, baudrate=115200, enable_watchdog=True, enable_log=False):
         """
         Initialize ESP32 communicator with control layers.
         
@@ -49,6 +57,7 @@ class ESP32Communicator:
             port: Serial port (e.g., 'COM3'). If None, will auto-detect.
             baudrate: Communication speed (default: 115200)
             enable_watchdog: Enable communication monitoring (recommended)
+            enable_log: Keep the last 1000 commands for get_command_log()
         """
         self.port = port
         self.baudrate = baudrate
@@ -62,14 +71,20 @@ class ESP32Communicator:
         # Legacy compatibility
         self.serial_conn = None
         self.command_queue = queue.Queue()
-        self.response_queue = queue.Queue()
+        
+        # Responses for wait_for_response() - single producer (RX thread),
+        # single consumer, so a bounded deque + Event replaces queue.Queue
+        self.response_queue = deque(maxlen=256)
+        self._resp_event = threading.Event()
+        self._put_response = self.response_queue.append
         
         # Callback for received messages
         self.on_response_callback = None
         
-        # Command logging
-        self.command_log = []
-        self.max_log_size = 1000
+        # Command logging - ring of (monotonic_ns, command, sent) tuples.
+        # max_log_size == 0 means logging is off.
+        self.max_log_size = 1000 if enable_log else 0
+        self.command_log = deque(maxlen=self.max_log_size)
         
         # Watchdog enabled flag
         self.enable_watchdog = enable_watchdog
@@ -77,6 +92,9 @@ class ESP32Communicator:
         # Update timer for queue processing
         self.update_thread = None
         self.running = False
+        
+        # disconnect() is registered with atexit while connected
+        self._atexit_registered = False
     
     def list_available_ports(self):
         """
@@ -131,17 +149,9 @@ class ESP32Communicator:
             if self.enable_watchdog:
                 self.watchdog = Watchdog(timeout=2.0, enable_heartbeat=False)
                 
-                # Connect watchdog to serial link
-                original_msg_handler = self.serial_link.on_message
-                
-                def msg_handler_with_watchdog(msg):
-                    self.watchdog.kick()  # Reset watchdog on any message
-                    if msg == "HB":
-                        self.watchdog.heartbeat()
-                    if original_msg_handler:
-                        original_msg_handler(msg)
-                
-                self.serial_link.on_message = msg_handler_with_watchdog
+                # Connect watchdog to serial link - the listener stores each
+                # line's arrival time straight into the watchdog
+                self.serial_link.attach_watchdog(self.watchdog)
                 
                 # Set up watchdog callbacks
                 self.watchdog.on_timeout = self._handle_watchdog_timeout
@@ -157,6 +167,12 @@ class ESP32Communicator:
             self.update_thread.start()
             
             self.is_connected = True
+            
+            # Make sure the port is released at interpreter exit
+            if not self._atexit_registered:
+                atexit.register(self.disconnect)
+                self._atexit_registered = True
+            
             print(f"✅ ESP32 Communicator: All layers active")
             return True
             
@@ -172,8 +188,10 @@ class ESP32Communicator:
         if not self.is_connected:
             return
         
-        # Stop update thread
+        # Stop update thread - wake it so it sees running=False right away
         self.running = False
+        if self.motion_queue:
+            self.motion_queue._wake.set()
         if self.update_thread and self.update_thread.is_alive():
             self.update_thread.join(timeout=2)
         
@@ -188,6 +206,11 @@ class ESP32Communicator:
             self.serial_link.disconnect()
         
         self.is_connected = False
+        
+        if self._atexit_registered:
+            atexit.unregister(self.disconnect)
+            self._atexit_registered = False
+        
         print("🔌 Disconnected from ESP32")
     
     def send_command(self, command_string, priority=False):
@@ -195,21 +218,25 @@ class ESP32Communicator:
         Send command to ESP32 through motion queue.
         
         Args:
-            command_string: Command to send (from command_builder)
+            command_string: Command to send (bytes from command_builder, or str)
             priority: If True, sends immediately (for emergency stop)
         
         Returns:
             bool: True if queued/sent successfully
         """
         if not self.is_connected:
-            print(f"⚠ Not connected - Command queued for simulation only:")
-            print(command_string)
+            # Normal in simulation-only mode - one line per slider move
+            logger.debug("⚠ Not connected - Command queued for simulation only:\n%s",
+                         command_string)
             self._log_command(command_string, sent=False)
             return False
         
         if priority:
             # Emergency stop - bypass queue
-            print(f"🚨 EMERGENCY: {command_string[:50]}")
+            text = command_string[:50]
+            if isinstance(text, bytes):
+                text = text.decode('ascii', errors='replace')
+            print(f"🚨 EMERGENCY: {text}")
             if self.motion_queue:
                 self.motion_queue.emergency_stop()
             else:
@@ -230,29 +257,59 @@ class ESP32Communicator:
     def _update_worker(self):
         """
         Worker thread for updating motion queue and watchdog.
-        Runs at ~50 Hz.
+        
+        Sleeps on the motion queue's wake event, so it runs as soon as a
+        command is added or DONE:MOVE arrives. The watchdog is not polled:
+        the worker sleeps at most until its deadline and only calls
+        check() once that deadline has actually passed.
         """
+        # Layers are fixed for the life of this thread - resolve them once
+        mq = self.motion_queue
+        wd = self.watchdog
+        idle = self.WORKER_IDLE_TIMEOUT
+        sleep = time.sleep
+        update = mq.update if mq else None
+        wake = mq._wake if mq else None
+        time_remaining = wd.time_remaining if wd else None
+        
         while self.running:
             try:
                 # Update motion queue (send next command if ready)
-                if self.motion_queue:
-                    self.motion_queue.update()
+                if update is not None:
+                    update()
                 
-                # Check watchdog
-                if self.watchdog and self.watchdog.enabled:
-                    try:
-                        self.watchdog.check()
-                    except WatchdogTimeout as e:
-                        print(f"🚨 WATCHDOG TIMEOUT: {e}")
-                        # Emergency stop on watchdog timeout
-                        if self.motion_queue:
-                            self.motion_queue.emergency_stop()
+                wait = idle
                 
-                time.sleep(0.02)  # 50 Hz update rate
+                # Check watchdog only when its deadline is due
+                # (time_remaining() is inf while it is disabled)
+                if time_remaining is not None:
+                    remaining = time_remaining()
+                    if remaining <= 0:
+                        try:
+                            wd.check()
+                        except WatchdogTimeout as e:
+                            print(f"🚨 WATCHDOG TIMEOUT: {e}")
+                            # Emergency stop on watchdog timeout
+                            if mq:
+                                mq.emergency_stop()
+                        remaining = time_remaining()
+                    if remaining < wait:
+                        wait = max(remaining, 0.001)
+                
+                # Block until there is work or the watchdog is due
+                if wake is not None:
+                    wake.wait(wait)
+                    wake.clear()
+                else:
+                    sleep(wait)
+                
+                # disconnect() sets _wake after clearing running
+                if not self.running:
+                    break
                 
             except Exception as e:
                 print(f"❌ Update worker error: {e}")
-                time.sleep(0.1)
+                sleep(0.1)
     
     def _handle_esp32_message(self, msg):
         """
@@ -262,14 +319,15 @@ class ESP32Communicator:
             msg: Message string from ESP32
         """
         # Add to legacy response queue for compatibility
-        self.response_queue.put(msg)
+        self._put_response(msg)
+        self._resp_event.set()
         
         # Call user callback
         if self.on_response_callback:
             try:
                 self.on_response_callback(msg)
             except Exception as e:
-                print(f"⚠ Response callback error: {e}")
+                logger.warning("⚠ Response callback error: %s", e)
     
     def _handle_watchdog_timeout(self, time_since_response):
         """
@@ -289,25 +347,38 @@ class ESP32Communicator:
             self.serial_link.send(command_string)
         elif self.serial_conn and self.serial_conn.is_open:
             # Fallback to direct serial
-            if not command_string.endswith("\n"):
-                command_string += "\n"
-            self.serial_conn.write(command_string.encode('utf-8'))
+            if isinstance(command_string, str):
+                command_string = command_string.encode('utf-8')
+            if not command_string.endswith(b"\n"):
+                command_string += b"\n"
+            self.serial_conn.write(command_string)
+    
+    def drain(self):
+        """
+        Block until all written commands have left the serial port.
+        
+        Writes no longer flush individually, so call this when the bytes
+        must be on the wire (e.g. before shutting down).
+        
+        Returns:
+            bool: True if drained
+        """
+        if self.serial_link:
+            return self.serial_link.drain()
+        if self.serial_conn and self.serial_conn.is_open:
             self.serial_conn.flush()
+            return True
+        return False
     
     def _log_command(self, command_string, sent=True):
         """
         Log command for debugging and validation.
         """
-        timestamp = time.time()
-        self.command_log.append({
-            'timestamp': timestamp,
-            'command': command_string,
-            'sent': sent
-        })
+        if self.max_log_size == 0:
+            return
         
-        # Trim log if too large
-        if len(self.command_log) > self.max_log_size:
-            self.command_log = self.command_log[-self.max_log_size:]
+        # deque(maxlen) drops the oldest entry itself - no trimming needed
+        self.command_log.append((time.monotonic_ns(), command_string, sent))
     
     def get_command_log(self, count=10):
         """
@@ -317,9 +388,11 @@ class ESP32Communicator:
             count: Number of recent commands to return
         
         Returns:
-            list: Recent command log entries
+            list: Recent (timestamp, command, sent) tuples, oldest first.
+                Timestamps are time.monotonic_ns() values.
         """
-        return self.command_log[-count:]
+        log = self.command_log
+        return list(itertools.islice(log, max(0, len(log) - count), None))
     
     def clear_command_log(self):
         """
@@ -337,12 +410,23 @@ class ESP32Communicator:
         Returns:
             str: Response line or None if timeout
         """
-        try:
-            response = self.response_queue.get(timeout=timeout)
-            self.response_queue.task_done()
-            return response
-        except queue.Empty:
-            return None
+        responses = self.response_queue
+        event = self._resp_event
+        deadline = time.monotonic_ns() + int(timeout * 1e9)
+        
+        while True:
+            if responses:
+                return responses.popleft()
+            
+            # Clear before re-checking so a message that lands in between
+            # still leaves the event set
+            event.clear()
+            if responses:
+                continue
+            
+            remaining = deadline - time.monotonic_ns()
+            if remaining <= 0 or not event.wait(remaining / 1e9):
+                return responses.popleft() if responses else None
     
     def is_ready(self):
         """
@@ -391,11 +475,20 @@ class ESP32Communicator:
         else:
             self.send_command("$STOP$", priority=True)
     
-    def __del__(self):
+    def __enter__(self):
         """
-        Cleanup on object destruction.
+        Connect (if needed) on entering a with-block.
+        
+        Check is_connected inside the block - a failed connect does not raise.
         """
+        if not self.is_connected:
+            self.connect()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Disconnect on leaving a with-block."""
         self.disconnect()
+        return False
 
 
 # Global communicator instance (singleton pattern)
@@ -432,6 +525,8 @@ def send_command_to_esp32(command_string, priority=False):
 
 # Testing
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+    
     print("ESP32 Communicator Test")
     print("=" * 50)
     
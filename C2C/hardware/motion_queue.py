@@ -3,7 +3,7 @@ Motion Queue - Buffered Command Execution
 
 Ensures smooth, safe, and deterministic robot motion by:
 1. Buffering commands in a queue
-2. Sending one command at a time
+2. Sending one command at a time (or a small pipelined window)
 3. Waiting for DONE:MOVE before sending next
 4. Preventing command flooding to ESP32
 
@@ -15,16 +15,22 @@ USAGE:
     queue.update()      # Call in main loop to process queue
     
 RULES:
-1. Only one command in flight at a time
-2. Must receive DONE:MOVE before sending next
+1. Only one command in flight at a time (max_in_flight=1, the default)
+2. Must receive DONE:MOVE before sending next - with max_in_flight > 1
+   every DONE:MOVE frees one slot of the window
 3. Emergency stop clears entire queue
 4. Queue has maximum size to prevent memory overflow
 """
 
-from collections import deque
 import time
+import logging
 import threading
 
+# Pre-framed emergency stop, written straight to the port
+_STOP_BYTES = b"$STOP$\n"
+
+logger = logging.getLogger(__name__)
+
 
 class MotionQueue:
     """
@@ -32,24 +38,37 @@ class MotionQueue:
     
     Maintains a FIFO queue of commands and sends them one at a time,
     waiting for DONE:MOVE acknowledgment before proceeding.
+    
+    The FIFO is a preallocated list of max_size slots indexed by
+    free-running head/tail counters (slot = counter % max_size, length =
+    head - tail). Only add() moves head and only update() moves tail, so
+    producers and the
+    consumer never contend on the same lock.
     """
     
-    def __init__(self, serial_link, max_size=100):
+    def __init__(self, serial_link, max_size=100, max_in_flight=1):
         """
         Initialize motion queue.
         
         Args:
             serial_link: ESP32Serial instance for sending commands
             max_size: Maximum queue size (prevents memory overflow)
+            max_in_flight: Commands allowed on the wire before DONE:MOVE.
+                Keep at 1 unless the firmware buffers incoming moves.
         """
         self.serial = serial_link
-        self.queue = deque()
         self.max_size = max_size
+        self.max_in_flight = max(1, max_in_flight)
+        
+        # Ring buffer - exactly max_size slots, never resized
+        self._slots = [None] * max_size
+        self.head = 0                  # Commands ever added (advanced by add)
+        self.tail = 0                  # Commands ever sent (advanced by update)
         
         # State tracking
-        self.busy = False              # True when command in flight
-        self.current_command = None    # Command currently executing
-        self.command_start_time = 0    # When current command was sent
+        self.in_flight = 0             # Commands sent but not yet DONE
+        self.current_command = None    # Last command sent
+        self.command_start_time = 0    # monotonic_ns when the oldest in-flight command started
         
         # Statistics
         self.commands_sent = 0
@@ -57,7 +76,12 @@ class MotionQueue:
         self.commands_dropped = 0
         
         # Thread safety
-        self.lock = threading.Lock()
+        self.lock = threading.Lock()         # Send/busy state, clear, stop
+        self._add_lock = threading.Lock()    # Producers (UI, teach, weld threads)
+        self.cv = threading.Condition(self.lock)  # Signalled when work drains
+        
+        # Set whenever there may be work for update() (new command or DONE:MOVE)
+        self._wake = threading.Event()
         
         # Connect to serial link callbacks
         self._setup_callbacks()
@@ -69,82 +93,146 @@ class MotionQueue:
         # When DONE:MOVE received, mark not busy
         self.serial.on_done_move = self.on_done
         
-        # When fault received, stop queue
-        original_fault_handler = self.serial.on_fault
-        
-        def fault_handler(fault_type):
-            print(f"⚠ Motion Queue: Fault detected ({fault_type}) - clearing queue")
-            self.clear()
-            if original_fault_handler:
-                original_fault_handler(fault_type)
+        # When fault received, stop queue (chaining any existing handler)
+        self._chained_fault_handler = self.serial.on_fault
+        self.serial.on_fault = self._on_fault
+    
+    def _on_fault(self, fault_type):
+        """
+        FAULT:* handler - clear the queue, then pass the fault on.
         
-        self.serial.on_fault = fault_handler
+        Args:
+            fault_type: Fault name from the ESP32 (e.g. 'LIMIT')
+        """
+        logger.warning("⚠ Motion Queue: Fault detected (%s) - clearing queue", fault_type)
+        self.clear()
+        chained = self._chained_fault_handler
+        if chained:
+            chained(fault_type)
     
     def add(self, command):
         """
         Add command to queue.
         
+        The command is encoded to newline-terminated bytes here, on the
+        producer's thread, so the worker can write it out as-is.
+        
         Args:
-            command: Command string to queue
+            command: Command string (or already-encoded bytes) to queue
         
         Returns:
             bool: True if queued, False if queue full
         """
-        with self.lock:
-            if len(self.queue) >= self.max_size:
-                print(f"⚠ Motion Queue: Full ({self.max_size}) - dropping command")
+        if isinstance(command, str):
+            command = command.encode('ascii')
+        if not command.endswith(b'\n'):
+            command += b'\n'
+        
+        with self._add_lock:
+            head = self.head
+            full = head - self.tail >= self.max_size
+            if full:
+                # Several producers can land here - keep the count under
+                # their lock so increments are not lost
                 self.commands_dropped += 1
-                return False
-            
-            self.queue.append(command)
-            return True
+            else:
+                # Fill the slot before publishing the new head
+                self._slots[head % self.max_size] = command
+                self.head = head + 1
+        
+        if full:
+            logger.warning("⚠ Motion Queue: Full (%d) - dropping command", self.max_size)
+            return False
+        
+        self._wake.set()
+        return True
     
     def update(self):
         """
         Process queue - send next command if not busy.
         
-        Call this regularly from your main loop or timer.
-        Typically called at 10-100 Hz.
+        Call this regularly from your main loop or timer, or block on
+        _wake between calls so it runs as soon as there is work.
         """
+        # Fast path without the lock: nothing queued, or window full.
+        # A racing add()/on_done() sets _wake, so a stale read only
+        # defers the work to the next call.
+        if self.head == self.tail or self.in_flight >= self.max_in_flight:
+            return
+        
         with self.lock:
-            # If busy, wait for DONE:MOVE
-            if self.busy:
+            # If the in-flight window is full, wait for DONE:MOVE
+            free = self.max_in_flight - self.in_flight
+            if free <= 0:
                 return
             
             # If queue empty, nothing to do
-            if not self.queue:
+            tail = self.tail
+            head = self.head
+            if tail == head:
                 return
             
-            # Get next command
-            command = self.queue.popleft()
+            # Peek as many commands as the window allows - tail only
+            # advances once they are on the wire
+            slots = self._slots
+            size = self.max_size
+            count = min(free, head - tail)
+            if count == 1:
+                command = slots[tail % size]
+                payload = command
+            else:
+                # Coalesce the batch into a single write (entries are
+                # already newline-terminated bytes)
+                batch = [slots[(tail + i) % size] for i in range(count)]
+                command = batch[-1]
+                payload = b''.join(batch)
             
-            # Send command
-            if self.serial.send(command):
-                self.busy = True
+            # Send command(s)
+            sent = self.serial.send(payload)
+            if sent:
+                for i in range(count):
+                    slots[(tail + i) % size] = None
+                self.tail = tail + count
+                if self.in_flight == 0:
+                    self.command_start_time = time.monotonic_ns()
+                self.in_flight += count
                 self.current_command = command
-                self.command_start_time = time.time()
-                self.commands_sent += 1
-            else:
-                # Send failed - requeue at front
-                print("⚠ Motion Queue: Send failed - requeueing")
-                self.queue.appendleft(command)
+        
+        # Statistics are only written by this (single consumer) thread, so
+        # they do not need the lock
+        if sent:
+            self.commands_sent += count
+        else:
+            # Send failed - they stay at the front for the next update
+            logger.warning("⚠ Motion Queue: Send failed - retrying")
     
     def on_done(self):
         """
         Called when DONE:MOVE received from ESP32.
-        Marks queue as not busy so next command can be sent.
+        Frees one in-flight slot so the next command can be sent.
         """
         with self.lock:
-            if not self.busy:
-                print("⚠ Motion Queue: Received DONE:MOVE but not busy")
+            if self.in_flight == 0:
+                logger.warning("⚠ Motion Queue: Received DONE:MOVE but not busy")
                 return
             
-            execution_time = time.time() - self.command_start_time
-            print(f"✅ Motion Queue: Command completed ({execution_time:.2f}s)")
+            now = time.monotonic_ns()
+            execution_ms = (now - self.command_start_time) // 1_000_000
             
-            self.busy = False
-            self.current_command = None
-            self.commands_completed += 1
+            self.in_flight -= 1
+            if self.in_flight:
+                # Next pipelined command starts executing now
+                self.command_start_time = now
+            else:
+                self.current_command = None
+            self.cv.notify_all()
+        
+        # DONE:MOVE only arrives on the serial RX thread - single writer
+        self.commands_completed += 1
+        logger.debug("✅ Motion Queue: Command completed (%.2fs)", execution_ms / 1000)
+        
+        # Dispatch the next command right away instead of on the next poll
+        self._wake.set()
     
     def clear(self):
         """
@@ -154,10 +242,21 @@ class MotionQueue:
         Does NOT stop current command - use emergency_stop() for that.
         """
         with self.lock:
-            dropped = len(self.queue)
-            self.queue.clear()
-            if dropped > 0:
-                print(f"⚠ Motion Queue: Cleared {dropped} commands")
+            self._drain()
+    
+    def _drain(self):
+        """
+        Drop every queued command. Caller must hold self.lock.
+        """
+        head = self.head
+        tail = self.tail
+        dropped = head - tail
+        for i in range(tail, head):
+            self._slots[i % self.max_size] = None
+        self.tail = head
+        self.cv.notify_all()
+        if dropped > 0:
+            logger.info("⚠ Motion Queue: Cleared %d commands", dropped)
     
     def emergency_stop(self):
         """
@@ -167,16 +266,32 @@ class MotionQueue:
         """
         with self.lock:
             # Clear queue
-            self.clear()
+            self._drain()
             
-            # Send emergency stop (bypass queue)
-            stop_cmd = "$STOP$"
-            print(f"🚨 Motion Queue: EMERGENCY STOP")
-            self.serial.send(stop_cmd)
+            # Send emergency stop (bypass queue and send() framing). In
+            # asyncio mode the loop's transport owns the port and may be
+            # part-way through a MOVE, so the STOP must queue behind it
+            logger.warning("🚨 Motion Queue: EMERGENCY STOP")
+            ser = getattr(self.serial, 'ser', None)
+            if ser is not None and getattr(self.serial, '_transport', None) is None:
+                try:
+                    ser.write(_STOP_BYTES)
+                    ser.flush()
+                except Exception as e:
+                    logger.error("❌ Motion Queue: Direct STOP write failed - %s", e)
+                    self.serial.send(_STOP_BYTES)
+            else:
+                self.serial.send(_STOP_BYTES)
             
             # Reset state
-            self.busy = False
+            self.in_flight = 0
             self.current_command = None
+            self.cv.notify_all()
+    
+    @property
+    def busy(self):
+        """True while at least one command is waiting for DONE:MOVE."""
+        return self.in_flight > 0
     
     def is_busy(self):
         """
@@ -194,7 +309,7 @@ class MotionQueue:
         Returns:
             int: Number of queued commands
         """
-        return len(self.queue)
+        return self.head - self.tail
     
     def get_stats(self):
         """
@@ -203,13 +318,18 @@ class MotionQueue:
         Returns:
             dict: Statistics including sent, completed, dropped counts
         """
+        # Snapshot everything in one expression, then build the dict
+        head, tail, in_flight, sent, completed, dropped, current = (
+            self.head, self.tail, self.in_flight, self.commands_sent,
+            self.commands_completed, self.commands_dropped, self.current_command)
         return {
-            'queued': len(self.queue),
-            'busy': self.busy,
-            'sent': self.commands_sent,
-            'completed': self.commands_completed,
-            'dropped': self.commands_dropped,
-            'current': self.current_command
+            'queued': head - tail,
+            'busy': in_flight > 0,
+            'in_flight': in_flight,
+            'sent': sent,
+            'completed': completed,
+            'dropped': dropped,
+            'current': current
         }
     
     def wait_until_empty(self, timeout=30.0):
@@ -224,27 +344,28 @@ class MotionQueue:
         Returns:
             bool: True if empty, False if timeout
         """
-        start_time = time.time()
+        deadline = time.monotonic_ns() + int(timeout * 1e9)
         
-        while True:
-            with self.lock:
-                if not self.busy and len(self.queue) == 0:
-                    return True
-            
-            # Check timeout
-            if time.time() - start_time > timeout:
-                print(f"⚠ Motion Queue: wait_until_empty() timeout")
-                return False
-            
-            time.sleep(0.1)
+        with self.cv:
+            while self.in_flight or self.head != self.tail:
+                remaining = deadline - time.monotonic_ns()
+                if remaining <= 0 or not self.cv.wait(timeout=remaining / 1e9):
+                    # Re-check: the last DONE may have landed right at the deadline
+                    if self.in_flight == 0 and self.head == self.tail:
+                        break
+                    logger.warning("⚠ Motion Queue: wait_until_empty() timeout")
+                    return False
+        return True
     
     def __repr__(self):
         """String representation for debugging."""
-        return f"MotionQueue(queued={len(self.queue)}, busy={self.busy})"
+        return f"MotionQueue(queued={self.get_queue_size()}, busy={self.busy})"
 
 
 # Testing
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+    
     print("Motion Queue Test")
     print("=" * 50)
     
@@ -17,13 +17,96 @@ RULES:
 2. PC never sends next motion until DONE:MOVE received
 3. Emergency stop bypasses queue
 4. Callbacks notify higher layers of state changes
+
+CALLBACK WIRING:
+    User callbacks (on_ack_move, on_fault, on_message, ...) are guarded -
+    an exception is logged and the listener keeps running.
+
+    Bring-up attaches the watchdog directly - each line then costs one
+    float store into the watchdog's timestamp slot, no call at all:
+
+        link.attach_watchdog(watchdog)
 """
 
 import serial
 import serial.tools.list_ports
+import asyncio
+import logging
+import os
+import select
+import sys
 import threading
 import time
 
+# Linux serial_struct ioctls (linux/serial.h), for low-latency mode
+_TIOCGSERIAL = 0x541E
+_TIOCSSERIAL = 0x541F
+_ASYNC_LOW_LATENCY = 0x2000
+_SERIAL_FLAGS_OFFSET = 16  # type, line, port, irq, then flags (all 4 bytes)
+
+_log = logging.getLogger("C2C.serial")
+
+# Optional: event-loop driven receive path (connect_async)
+try:
+    import serial_asyncio
+except ImportError:
+    serial_asyncio = None
+
+
+# Fixed protocol lines. Received lines are matched as raw bytes - they
+# are only decoded when a caller needs text.
+ACK_MOVE = b"ACK:MOVE"
+DONE_MOVE = b"DONE:MOVE"
+ACK_STOP = b"ACK:STOP"
+HEARTBEAT = b"HB"
+FAULT_PREFIX = b"FAULT:"
+
+# Exact-match line -> name of the ESP32Serial callback attribute it fires
+# (FAULT:* lines are matched by prefix). Looked up at call time, so
+# callbacks can be reassigned freely.
+_DISPATCH = {
+    ACK_MOVE: 'on_ack_move',
+    DONE_MOVE: 'on_done_move',
+    ACK_STOP: 'on_ack_stop',
+    HEARTBEAT: 'on_heartbeat',
+}
+
+
+def _safe_invoke(fn, *args):
+    """
+    Call a user-supplied callback, logging (not raising) its errors.
+    
+    Args:
+        fn: Callback to invoke
+        *args: Arguments passed to the callback
+    """
+    try:
+        fn(*args)
+    except Exception as e:
+        _log.error("⚠ %s callback error: %s", getattr(fn, '__name__', fn), e)
+
+
+class _ACKProtocol(asyncio.Protocol):
+    """
+    asyncio protocol feeding received bytes into an ESP32Serial.
+    
+    data_received runs on the event loop as soon as the port is readable,
+    replacing the listener thread.
+    """
+    
+    def __init__(self, link):
+        self._link = link
+    
+    def data_received(self, data):
+        self._link._feed(data)
+    
+    def connection_lost(self, exc):
+        link = self._link
+        link.connected = False
+        link._transport = None
+        if exc:
+            print(f"❌ Serial Link: Connection lost - {exc}")
+
 
 class ESP32Serial:
     """
@@ -33,6 +116,13 @@ class ESP32Serial:
     ESP32 acknowledgment messages in a separate thread.
     """
     
+    # Blocking read timeout - bounds how long the listener takes to notice
+    # disconnect(), it does not delay messages
+    READ_TIMEOUT = 0.2
+    
+    # SCHED_FIFO priority requested for the listener thread (Linux only)
+    RX_PRIORITY = 10
+    
     def __init__(self, port=None, baudrate=115200):
         """
         Initialize serial link.
@@ -43,12 +133,19 @@ class ESP32Serial:
         """
         self.port = port
         self.baudrate = baudrate
-        self.ser = None
+        self.ser = None  # Open port in thread mode; stays None in asyncio mode
         self.running = False
         self.connected = False
         
-        # ACK state tracking
-        self.last_ack = None
+        # Attached watchdog's last-response slot (see attach_watchdog)
+        self._wd_ts = None
+        
+        # Per-message trace is off unless set_debug(True)
+        self.debug = False
+        self._log = _log
+        
+        # ACK state tracking (raw bytes; last_ack decodes on read)
+        self._last_ack = None
         self.last_ack_time = 0
         
         # Callbacks for different message types
@@ -57,10 +154,25 @@ class ESP32Serial:
         self.on_ack_stop = None        # Called when ACK:STOP received
         self.on_fault = None           # Called when FAULT:* received
         self.on_heartbeat = None       # Called when HB received
-        self.on_message = None         # Called for any message
+        self.on_other = None           # Called with text of unrecognised lines
+        self.on_message = None         # Called for any message (with text)
         
-        # Listener thread
+        # Listener thread, its reusable read buffer, and the accumulator
+        # that carries a partial line over to the next read
         self.listen_thread = None
+        self._rx_buf = bytearray(4096)
+        self._rx_view = memoryview(self._rx_buf)
+        self._rx = bytearray()
+        
+        # POSIX raw-fd receive path, set up in connect(): the port's fd and
+        # a wait_readable(timeout_ms) built on poll() or select()
+        self._fd = None
+        self._wait_readable = None
+        
+        # Set instead of the listener thread when connected via connect_async
+        self._transport = None
+        self._loop = None
+        self._loop_thread = None  # Thread running _loop, if connect_async_threaded started it
     
     def list_ports(self):
         """
@@ -102,10 +214,13 @@ class ESP32Serial:
             self.ser = serial.Serial(
                 port=self.port,
                 baudrate=self.baudrate,
-                timeout=1,
+                timeout=self.READ_TIMEOUT,
                 write_timeout=1
             )
             
+            # Ask the driver to deliver bytes immediately (Linux)
+            self._set_low_latency()
+            
             # Wait for ESP32 to initialize
             time.sleep(2)
             
@@ -115,9 +230,15 @@ class ESP32Serial:
             
             self.connected = True
             
+            # On POSIX, wait on the raw fd and read it directly
+            self._fd, self._wait_readable = self._open_raw_reader()
+            
             # Start listener thread
+            self._rx.clear()
             self.running = True
-            self.listen_thread = threading.Thread(target=self._listen, daemon=True)
+            self.listen_thread = threading.Thread(
+                target=self._listen, name=f"ESP32-RX-{self.port}", daemon=True
+            )
             self.listen_thread.start()
             
             print(f"✅ Serial Link: Connected to {self.port}")
@@ -128,11 +249,217 @@ class ESP32Serial:
             self.connected = False
             return False
     
+    def _set_low_latency(self):
+        """
+        Set ASYNC_LOW_LATENCY on the port (Linux only).
+        
+        USB-serial adapters such as FTDI otherwise hold received bytes for
+        up to 16 ms before passing them up, which delays every DONE:MOVE.
+        Same fix as MAVROS / mavlink-router apply to their FTDI links.
+        Devices without serial_struct support (CP210x, ptys, ...) reject
+        the ioctl and are left untouched.
+        
+        Returns:
+            bool: True if low-latency mode is on
+        """
+        if not sys.platform.startswith('linux'):
+            return False
+        
+        try:
+            import fcntl
+            import struct
+            
+            fd = self.ser.fileno()
+            # Oversized buffer - the kernel fills sizeof(struct serial_struct)
+            buf = bytearray(fcntl.ioctl(fd, _TIOCGSERIAL, bytes(128)))
+            flags = struct.unpack_from('i', buf, _SERIAL_FLAGS_OFFSET)[0]
+            if not flags & _ASYNC_LOW_LATENCY:
+                struct.pack_into('i', buf, _SERIAL_FLAGS_OFFSET, flags | _ASYNC_LOW_LATENCY)
+                fcntl.ioctl(fd, _TIOCSSERIAL, bytes(buf))
+            return True
+        except (OSError, AttributeError, ValueError):
+            return False
+    
+    def _raise_rx_priority(self):
+        """
+        Move the calling (listener) thread to SCHED_FIFO (Linux only).
+        
+        A SCHED_OTHER thread can be preempted for tens of ms by unrelated
+        work, which delays DONE:MOVE and so the next send. Needs root or
+        CAP_SYS_NICE on the interpreter, e.g.:
+            sudo setcap cap_sys_nice+ep "$(readlink -f "$(which python3)")"
+        Without it the thread silently stays at normal priority.
+        
+        Returns:
+            bool: True if real-time scheduling is on
+        """
+        if not hasattr(os, 'sched_setscheduler'):
+            return False
+        
+        try:
+            # pid 0 is the calling thread on Linux, not the whole process
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(self.RX_PRIORITY))
+            return True
+        except OSError:
+            return False  # PermissionError without CAP_SYS_NICE
+    
+    def _open_raw_reader(self):
+        """
+        Set up the raw-fd listener path for the open port (POSIX only).
+        
+        Linux uses poll(); other POSIX systems use select(), since macOS
+        poll() does not support tty devices.
+        
+        Returns:
+            tuple: (fd, wait_readable) or (None, None) to use pyserial reads
+        """
+        if os.name != 'posix':
+            return None, None
+        
+        try:
+            fd = self.ser.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None, None  # Not a real fd (e.g. URL handler)
+        
+        if sys.platform.startswith('linux') and hasattr(select, 'poll'):
+            poller = select.poll()
+            poller.register(fd, select.POLLIN)
+            return fd, poller.poll
+        
+        def wait_readable(timeout_ms):
+            return select.select((fd,), (), (), timeout_ms / 1000)[0]
+        return fd, wait_readable
+    
+    async def connect_async(self, port=None):
+        """
+        Connect to ESP32 on the running asyncio loop (needs pyserial-asyncio).
+        
+        Received lines are dispatched from the event loop instead of a
+        listener thread. send() may still be called from any thread.
+        Without a running loop, use connect_async_threaded().
+        
+        Args:
+            port: Serial port. If None, uses self.port
+        
+        Returns:
+            bool: True if connected successfully
+        """
+        if self.connected:
+            print("⚠ Already connected")
+            return True
+        
+        if serial_asyncio is None:
+            print("❌ Serial Link: pyserial-asyncio not installed - use connect()")
+            return False
+        
+        if port:
+            self.port = port
+        if not self.port:
+            print("❌ Serial Link: No port specified")
+            return False
+        
+        try:
+            loop = asyncio.get_running_loop()
+            self._rx.clear()
+            transport, _ = await serial_asyncio.create_serial_connection(
+                loop, lambda: _ACKProtocol(self), self.port, baudrate=self.baudrate
+            )
+            
+            # Wait for ESP32 to initialize, then drop its boot chatter
+            await asyncio.sleep(2)
+            transport.serial.reset_input_buffer()
+            self._rx.clear()
+            
+            self._loop = loop
+            # self.ser stays None: the port belongs to the transport, and
+            # writing it from another thread could split a frame in flight
+            self._transport = transport
+            self.connected = True
+            
+            print(f"✅ Serial Link: Connected to {self.port} (asyncio)")
+            return True
+            
+        except (serial.SerialException, OSError) as e:
+            print(f"❌ Serial Link: Connection failed - {e}")
+            self.connected = False
+            return False
+    
+    def connect_async_threaded(self, port=None, timeout=10.0):
+        """
+        connect_async() for callers that do not run an event loop.
+        
+        Starts a daemon thread with its own asyncio loop and connects on
+        it; received lines are then dispatched from that thread, and
+        disconnect() stops it again.
+        
+        Args:
+            port: Serial port. If None, uses self.port
+            timeout: Seconds to wait for the connection (includes the 2 s
+                ESP32 boot wait)
+        
+        Returns:
+            bool: True if connected successfully
+        """
+        if self.connected:
+            print("⚠ Already connected")
+            return True
+        
+        if serial_asyncio is None:
+            print("❌ Serial Link: pyserial-asyncio not installed - use connect()")
+            return False
+        
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, name="serial-asyncio", daemon=True)
+        thread.start()
+        self._loop_thread = thread
+        
+        future = asyncio.run_coroutine_threadsafe(self.connect_async(port), loop)
+        try:
+            connected = future.result(timeout)
+        except Exception as e:
+            future.cancel()
+            print(f"❌ Serial Link: Connection failed - {e or 'timed out'}")
+            connected = False
+        
+        if not connected:
+            self._stop_loop_thread(loop)
+        return connected
+    
+    def _stop_loop_thread(self, loop=None):
+        """Stop and close the loop started by connect_async_threaded, if any."""
+        thread, self._loop_thread = self._loop_thread, None
+        if thread is None:
+            return
+        loop = loop or self._loop
+        # Stop one pass later, so callbacks already queued (e.g. a
+        # transport's close) still run
+        loop.call_soon_threadsafe(loop.call_soon, loop.stop)
+        thread.join(timeout=2)
+        if not thread.is_alive():
+            loop.close()
+    
     def disconnect(self):
         """
         Disconnect from ESP32.
         """
         if not self.connected:
+            # A lost connection leaves the loop thread running
+            self._stop_loop_thread()
+            return
+        
+        # asyncio transport owns the port - close it on its own loop
+        if self._transport is not None:
+            transport, self._transport = self._transport, None
+            self._loop.call_soon_threadsafe(transport.close)
+            if self._loop_thread is not None:
+                self._stop_loop_thread()
+                # The loop is gone now; close the port here if the
+                # transport had not finished closing it
+                port = transport.serial
+                if port is not None and port.is_open:
+                    port.close()
+            self.connected = False
+            print("🔌 Serial Link: Disconnected")
             return
         
         # Stop listener thread
@@ -143,6 +470,7 @@ class ESP32Serial:
         # Close serial connection
         if self.ser and self.ser.is_open:
             self.ser.close()
+        self.ser = None
         
         self.connected = False
         print("🔌 Serial Link: Disconnected")
@@ -152,112 +480,225 @@ class ESP32Serial:
         Send command to ESP32.
         
         Args:
-            command: Command string to send
+            command: Command string, or pre-encoded bytes (written as-is
+                apart from the trailing newline check)
         
         Returns:
             bool: True if sent successfully
         """
-        if not self.connected or not self.ser:
-            print(f"⚠ Serial Link: Not connected - cannot send: {command[:50]}")
+        if not self.connected or (self.ser is None and self._transport is None):
+            self._log.warning("⚠ Serial Link: Not connected - cannot send: %.50s", command)
             return False
         
         try:
+            if isinstance(command, str):
+                command = command.encode('utf-8')
+            
             # Ensure command ends with newline
-            if not command.endswith('\n'):
-                command += '\n'
+            if not command.endswith(b'\n'):
+                command += b'\n'
             
-            self.ser.write(command.encode('utf-8'))
-            self.ser.flush()
+            # asyncio mode - the port is non-blocking, let the transport
+            # buffer the write on its loop
+            transport = self._transport
+            if transport is not None:
+                self._loop.call_soon_threadsafe(transport.write, command)
+                return True
+            
+            # No flush() here - on POSIX it is tcdrain(), which blocks until
+            # the UART has shifted every byte out. Use drain() when needed.
+            self.ser.write(command)
             return True
             
         except Exception as e:
-            print(f"❌ Serial Link: Send failed - {e}")
+            self._log.error("❌ Serial Link: Send failed - %s", e)
+            return False
+    
+    def drain(self):
+        """
+        Block until everything written so far has left the port.
+        
+        Not available in asyncio mode, where the transport's loop owns
+        the port.
+        
+        Returns:
+            bool: True if drained, False if not connected (or in asyncio
+                mode) or flush failed
+        """
+        if not self.connected or not self.ser:
+            return False
+        
+        try:
+            self.ser.flush()
+            return True
+        except Exception as e:
+            print(f"❌ Serial Link: Drain failed - {e}")
             return False
     
     def _listen(self):
         """
         Background thread that listens for ESP32 messages.
         Parses and dispatches ACK messages to callbacks.
+        
+        Blocks for the first byte, then takes whatever else has arrived in
+        the same read, so a burst of ACK lines is handled in one pass. The
+        read timeout only exists to re-check self.running.
+        """
+        if self._raise_rx_priority():
+            self._log.info("⚙ Serial Link: Listener running SCHED_FIFO %d", self.RX_PRIORITY)
+        
+        if self._wait_readable is not None:
+            self._listen_fd()
+            return
+        
+        ser = self.ser
+        view = self._rx_view
+        size = len(view)
+        
+        while self.running:
+            try:
+                # readinto() blocks until its slice is full, so size the
+                # slice to what is already waiting (at least one byte)
+                n = ser.readinto(view[:min(ser.in_waiting or 1, size)])
+                if n:
+                    self._feed(view[:n])
+                
+            except Exception as e:
+                print(f"❌ Serial Link: Listen error - {e}")
+                time.sleep(0.1)
+    
+    def _listen_fd(self):
         """
-        buffer = ""
+        POSIX listener: wait for the port's fd, then one read per wakeup.
+        
+        One syscall while idle (the wait, until READ_TIMEOUT) and two per
+        burst, instead of pyserial's in_waiting ioctl + select + read. The
+        wait and the read both run without the GIL, and the read lands in
+        the preallocated _rx_buf, so it allocates nothing.
+        """
+        fd = self._fd
+        wait_readable = self._wait_readable
+        timeout_ms = int(self.READ_TIMEOUT * 1000)
+        feed = self._feed
+        bufs = [self._rx_buf]
+        view = self._rx_view
         
         while self.running:
             try:
-                if self.ser and self.ser.in_waiting:
-                    # Read available data
-                    data = self.ser.read(self.ser.in_waiting)
-                    buffer += data.decode('utf-8', errors='ignore')
-                    
-                    # Process complete lines
-                    while '\n' in buffer:
-                        line, buffer = buffer.split('\n', 1)
-                        msg = line.strip()
-                        
-                        if msg:
-                            self._handle_message(msg)
+                if not wait_readable(timeout_ms):
+                    continue
                 
-                time.sleep(0.01)  # 10ms polling interval
+                try:
+                    n = os.readv(fd, bufs)
+                except BlockingIOError:
+                    continue  # pyserial opens the fd O_NONBLOCK - spurious wakeup
+                if not n:
+                    # Readable but empty - device unplugged
+                    raise serial.SerialException("device reports readiness to read but returned no data")
+                feed(view[:n])
                 
             except Exception as e:
                 print(f"❌ Serial Link: Listen error - {e}")
                 time.sleep(0.1)
     
+    def _feed(self, data):
+        """
+        Append received bytes and dispatch every complete line.
+        
+        Args:
+            data: Bytes (or a memoryview of _rx_buf) read from the port
+        """
+        buf = self._rx
+        buf += data
+        
+        nl = buf.find(b'\n')
+        if nl < 0:
+            return
+        
+        # Walk the complete lines in place; only each message itself is
+        # copied out (it becomes a dict key and may reach user callbacks)
+        start = 0
+        with memoryview(buf) as mv:
+            while nl >= 0:
+                msg = bytes(mv[start:nl]).strip()
+                if msg:
+                    self._handle_message(msg)
+                start = nl + 1
+                nl = buf.find(b'\n', start)
+        
+        # Drop consumed lines; a partial tail stays buffered
+        del buf[:start]
+    
     def _handle_message(self, msg):
         """
         Parse and dispatch received message.
         
         Args:
-            msg: Message string from ESP32
+            msg: Stripped message bytes from ESP32 (ACKs never need decoding)
         """
-        self.last_ack = msg
-        self.last_ack_time = time.time()
+        self._last_ack = msg
+        self.last_ack_time = now = time.monotonic()
         
-        # Print for debugging
-        print(f"📥 ESP32: {msg}")
+        # Attached watchdog - every line is a sign of life
+        wd_ts = self._wd_ts
+        if wd_ts is not None:
+            wd_ts[0] = now
         
-        # Call generic message callback
+        # Trace for debugging (lazy %-formatting, skipped entirely when off)
+        if self.debug:
+            self._log.debug("📥 ESP32: %s", msg.decode('utf-8', errors='replace'))
+        
+        # Call generic message callback (text API - decode only if used)
         if self.on_message:
-            try:
-                self.on_message(msg)
-            except Exception as e:
-                print(f"⚠ Message callback error: {e}")
+            _safe_invoke(self.on_message, msg.decode('utf-8', errors='ignore'))
         
-        # Dispatch specific message types
-        if msg == "ACK:MOVE":
-            if self.on_ack_move:
-                try:
-                    self.on_ack_move()
-                except Exception as e:
-                    print(f"⚠ ACK:MOVE callback error: {e}")
+        # Exact-match lines go through the prebuilt table; FAULT:* is the
+        # only prefix match
+        name = _DISPATCH.get(msg)
+        if name is not None:
+            callback = getattr(self, name)
+            if callback:
+                _safe_invoke(callback)
+        elif msg[:6] == FAULT_PREFIX:
+            if self.on_fault:
+                # Prefix is fixed-length, so the payload is a single slice -
+                # no separator scan; a bare "FAULT:" reports UNKNOWN
+                fault_type = msg[6:].decode('ascii', errors='replace') or "UNKNOWN"
+                _safe_invoke(self.on_fault, fault_type)
+        elif self.on_other:
+            _safe_invoke(self.on_other, msg.decode('utf-8', errors='ignore'))
+    
+    def attach_watchdog(self, watchdog):
+        """
+        Feed a Watchdog straight from the listener.
         
-        elif msg == "DONE:MOVE":
-            if self.on_done_move:
-                try:
-                    self.on_done_move()
-                except Exception as e:
-                    print(f"⚠ DONE:MOVE callback error: {e}")
+        Every received line stores its arrival time into the watchdog's
+        timestamp slot, and HB lines call watchdog.heartbeat(). The watchdog
+        picks up recovery in its own check().
         
-        elif msg == "ACK:STOP":
-            if self.on_ack_stop:
-                try:
-                    self.on_ack_stop()
-                except Exception as e:
-                    print(f"⚠ ACK:STOP callback error: {e}")
+        Args:
+            watchdog: Watchdog instance, or None to detach
+        """
+        if watchdog is None:
+            self._wd_ts = None
+            self.on_heartbeat = None
+            return
+        self._wd_ts = watchdog._ts
+        self.on_heartbeat = watchdog.heartbeat
+    
+    def set_debug(self, enabled=True):
+        """
+        Turn the per-message trace on or off.
         
-        elif msg.startswith("FAULT:"):
-            fault_type = msg.split(":", 1)[1] if ":" in msg else "UNKNOWN"
-            if self.on_fault:
-                try:
-                    self.on_fault(fault_type)
-                except Exception as e:
-                    print(f"⚠ FAULT callback error: {e}")
+        Messages are logged at DEBUG on the "C2C.serial" logger, so that
+        logger must also be enabled to see them.
         
-        elif msg == "HB":
-            if self.on_heartbeat:
-                try:
-                    self.on_heartbeat()
-                except Exception as e:
-                    print(f"⚠ Heartbeat callback error: {e}")
+        Args:
+            enabled: True to trace every received line
+        """
+        self.debug = bool(enabled)
+        if enabled and not self._log.isEnabledFor(logging.DEBUG):
+            self._log.setLevel(logging.DEBUG)
     
     def is_connected(self):
         """
@@ -268,27 +709,47 @@ class ESP32Serial:
         """
         return self.connected
     
+    @property
+    def last_ack(self):
+        """Last received message as text, or None (decoded on access)."""
+        raw = self._last_ack
+        return raw.decode('utf-8', errors='ignore') if raw is not None else None
+    
     def get_last_ack(self):
         """
         Get the last received ACK message.
         
         Returns:
-            tuple: (message, timestamp) or (None, 0)
+            tuple: (message, time.monotonic() timestamp) or (None, 0)
         """
         return (self.last_ack, self.last_ack_time)
     
-    def __del__(self):
-        """Cleanup on destruction."""
+    def __enter__(self):
+        """
+        Connect (if needed) on entering a with-block.
+        
+        Check is_connected() inside the block - a failed connect does not raise.
+        """
+        if not self.connected:
+            self.connect()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Disconnect on leaving a with-block."""
         self.disconnect()
+        return False
 
 
 # Testing
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     print("Serial Link Test")
     print("=" * 50)
     
     # Create serial link
     link = ESP32Serial()
+    link.set_debug(True)
     
     # List ports
     ports = link.list_ports()
@@ -15,6 +15,9 @@ USAGE:
     # In your serial callback:
     watchdog.kick()  # Reset timer
     
+    # ...or let the serial listener store the timestamp itself:
+    link.attach_watchdog(watchdog)
+    
     # In your main loop:
     try:
         watchdog.check()  # Raises exception on timeout
@@ -30,7 +33,11 @@ RULES:
 """
 
 import time
+import logging
 import threading
+from array import array
+
+logger = logging.getLogger(__name__)
 
 
 class WatchdogTimeout(Exception):
@@ -44,6 +51,17 @@ class Watchdog:
     
     Tracks time since last response and triggers fault condition
     if ESP32 stops responding.
+    
+    No lock: each timestamp and counter has a single writer (the serial
+    listener kicks, the update worker checks) and attribute stores are
+    atomic under the GIL. The fault flag is a threading.Event so both
+    sides can flip and read it safely. Times are time.monotonic(), so a
+    wall-clock change cannot trip (or mask) a timeout.
+    
+    The last-response time lives in _ts, a one-slot array('d'), so a
+    serial listener holding a reference to it (ESP32Serial.attach_watchdog)
+    can record a response with a single store instead of calling kick().
+    check() then notices the fresh timestamp and handles recovery itself.
     """
     
     def __init__(self, timeout=2.0, enable_heartbeat=False):
@@ -56,14 +74,17 @@ class Watchdog:
         """
         self.timeout = timeout
         self.enable_heartbeat = enable_heartbeat
+        self._fast_threshold = timeout * 0.5   # check() returns early below this
         
-        # State tracking
-        self.last_response = time.time()
-        self.last_heartbeat = time.time()
+        # State tracking (_ts[0] is the last response time)
+        now = time.monotonic()
+        self._ts = array('d', [now])
+        self.last_heartbeat = now
+        self._fault_time = now         # When the current fault was detected
         self.enabled = True
-        self.fault_detected = False
+        self._fault_event = threading.Event()
         
-        # Statistics
+        # Statistics (kick_count counts kick() calls, not attached-listener stores)
         self.kick_count = 0
         self.timeout_count = 0
         self.heartbeat_count = 0
@@ -71,9 +92,20 @@ class Watchdog:
         # Callbacks
         self.on_timeout = None         # Called when timeout detected
         self.on_recovery = None        # Called when communication restored
-        
-        # Thread safety
-        self.lock = threading.Lock()
+    
+    @property
+    def last_response(self):
+        """time.monotonic() of the last ESP32 response."""
+        return self._ts[0]
+    
+    @last_response.setter
+    def last_response(self, value):
+        self._ts[0] = value
+    
+    @property
+    def fault_detected(self):
+        """True between a detected timeout and the next response."""
+        return self._fault_event.is_set()
     
     def kick(self):
         """
@@ -82,19 +114,24 @@ class Watchdog:
         This tells the watchdog that communication is healthy.
         Call this from your serial message callback.
         """
-        with self.lock:
-            self.last_response = time.time()
-            self.kick_count += 1
-            
-            # If recovering from fault, call recovery callback
-            if self.fault_detected:
-                self.fault_detected = False
-                print("✅ Watchdog: Communication restored")
-                if self.on_recovery:
-                    try:
-                        self.on_recovery()
-                    except Exception as e:
-                        print(f"⚠ Watchdog: Recovery callback error - {e}")
+        self._ts[0] = time.monotonic()
+        self.kick_count += 1
+        
+        # If recovering from fault, call recovery callback
+        if self._fault_event.is_set():
+            self._recover()
+    
+    def _recover(self):
+        """
+        Leave the fault state and call on_recovery.
+        """
+        self._fault_event.clear()
+        logger.info("✅ Watchdog: Communication restored")
+        if self.on_recovery:
+            try:
+                self.on_recovery()
+            except Exception as e:
+                logger.error("⚠ Watchdog: Recovery callback error - %s", e)
     
     def heartbeat(self):
         """
@@ -103,12 +140,32 @@ class Watchdog:
         If heartbeat monitoring is enabled, this must be called
         periodically (typically every 500ms from ESP32).
         """
-        with self.lock:
-            self.last_heartbeat = time.time()
-            self.heartbeat_count += 1
-            
-            # Heartbeat also counts as general response
-            self.kick()
+        self.last_heartbeat = time.monotonic()
+        self.heartbeat_count += 1
+        
+        # Heartbeat also counts as general response
+        self.kick()
+    
+    def _trip(self, elapsed, message):
+        """
+        Enter the fault state and raise. Called by check() only.
+        
+        Args:
+            elapsed: Seconds since the missed response/heartbeat
+            message: WatchdogTimeout message
+        """
+        self._fault_time = time.monotonic()
+        self._fault_event.set()
+        self.timeout_count += 1
+        
+        # Call timeout callback
+        if self.on_timeout:
+            try:
+                self.on_timeout(elapsed)
+            except Exception as e:
+                logger.error("⚠ Watchdog: Timeout callback error - %s", e)
+        
+        raise WatchdogTimeout(message)
     
     def check(self):
         """
@@ -123,51 +180,68 @@ class Watchdog:
         if not self.enabled:
             return
         
-        with self.lock:
-            current_time = time.time()
-            time_since_response = current_time - self.last_response
-            
-            # Check general timeout
-            if time_since_response > self.timeout:
-                if not self.fault_detected:
-                    self.fault_detected = True
-                    self.timeout_count += 1
-                    
-                    print(f"🚨 Watchdog: TIMEOUT - No response for {time_since_response:.2f}s")
-                    
-                    # Call timeout callback
-                    if self.on_timeout:
-                        try:
-                            self.on_timeout(time_since_response)
-                        except Exception as e:
-                            print(f"⚠ Watchdog: Timeout callback error - {e}")
-                    
-                    # Raise exception
-                    raise WatchdogTimeout(
-                        f"ESP32 not responding - {time_since_response:.1f}s since last response"
-                    )
+        # Fast path: a response (and heartbeat, if monitored) well inside the
+        # timeout. A stale read can only defer detection to the next call.
+        current_time = time.monotonic()
+        last_response = self._ts[0]
+        fast = self._fast_threshold
+        if current_time - last_response < fast and (
+                not self.enable_heartbeat or current_time - self.last_heartbeat < fast):
+            if self._fault_event.is_set():
+                self._recover()
+            return
+        
+        if self._fault_event.is_set():
+            # An attached listener stores responses without calling kick(),
+            # so recovery is noticed here
+            if last_response > self._fault_time:
+                self._recover()
+            return
+        
+        # Check general timeout
+        time_since_response = current_time - last_response
+        if time_since_response > self.timeout:
+            logger.warning("🚨 Watchdog: TIMEOUT - No response for %.2fs", time_since_response)
+            self._trip(
+                time_since_response,
+                f"ESP32 not responding - {time_since_response:.1f}s since last response"
+            )
+        
+        # Check heartbeat timeout (if enabled)
+        if self.enable_heartbeat:
+            time_since_heartbeat = current_time - self.last_heartbeat
+            heartbeat_timeout = self.timeout * 1.5  # More lenient than general timeout
             
-            # Check heartbeat timeout (if enabled)
-            if self.enable_heartbeat:
-                time_since_heartbeat = current_time - self.last_heartbeat
-                heartbeat_timeout = self.timeout * 1.5  # More lenient than general timeout
-                
-                if time_since_heartbeat > heartbeat_timeout:
-                    if not self.fault_detected:
-                        self.fault_detected = True
-                        self.timeout_count += 1
-                        
-                        print(f"🚨 Watchdog: HEARTBEAT LOST - {time_since_heartbeat:.2f}s since HB")
-                        
-                        if self.on_timeout:
-                            try:
-                                self.on_timeout(time_since_heartbeat)
-                            except Exception as e:
-                                print(f"⚠ Watchdog: Timeout callback error - {e}")
-                        
-                        raise WatchdogTimeout(
-                            f"ESP32 heartbeat lost - {time_since_heartbeat:.1f}s since HB"
-                        )
+            if time_since_heartbeat > heartbeat_timeout:
+                logger.warning("🚨 Watchdog: HEARTBEAT LOST - %.2fs since HB", time_since_heartbeat)
+                self._trip(
+                    time_since_heartbeat,
+                    f"ESP32 heartbeat lost - {time_since_heartbeat:.1f}s since HB"
+                )
+    
+    def time_remaining(self):
+        """
+        Seconds until check() could next detect a timeout.
+        
+        Lets a caller sleep until the deadline instead of polling check().
+        Kicks only ever push the deadline later, so waking early and
+        asking again is always safe.
+        
+        Returns:
+            float: Seconds left (<= 0 means check() is due now), or
+                inf while disabled or in fault with no response since
+        """
+        if not self.enabled:
+            return float('inf')
+        if self._fault_event.is_set():
+            # A response since the fault means check() has a recovery to run
+            return 0.0 if self._ts[0] > self._fault_time else float('inf')
+        
+        now = time.monotonic()
+        remaining = self.timeout - (now - self._ts[0])
+        if self.enable_heartbeat:
+            remaining = min(remaining, self.timeout * 1.5 - (now - self.last_heartbeat))
+        return remaining
     
     def is_healthy(self):
         """
@@ -176,22 +250,18 @@ class Watchdog:
         Returns:
             bool: True if within timeout period
         """
-        with self.lock:
-            time_since_response = time.time() - self.last_response
-            return time_since_response < self.timeout
+        return time.monotonic() - self.last_response < self.timeout
     
     def enable(self):
         """Enable watchdog monitoring."""
-        with self.lock:
-            self.enabled = True
-            self.last_response = time.time()  # Reset timer
-            print("✅ Watchdog: Enabled")
+        self.last_response = time.monotonic()  # Reset timer
+        self.enabled = True
+        logger.info("✅ Watchdog: Enabled")
     
     def disable(self):
         """Disable watchdog monitoring."""
-        with self.lock:
-            self.enabled = False
-            print("⏸ Watchdog: Disabled")
+        self.enabled = False
+        logger.info("⏸ Watchdog: Disabled")
     
     def reset(self):
         """
@@ -200,11 +270,11 @@ class Watchdog:
         Clears fault condition and resets all timers.
         Use when reconnecting or recovering from fault.
         """
-        with self.lock:
-            self.last_response = time.time()
-            self.last_heartbeat = time.time()
-            self.fault_detected = False
-            print("🔄 Watchdog: Reset")
+        now = time.monotonic()
+        self.last_response = now
+        self.last_heartbeat = now
+        self._fault_event.clear()
+        logger.info("🔄 Watchdog: Reset")
     
     def get_stats(self):
         """
@@ -212,19 +282,21 @@ class Watchdog:
         
         Returns:
             dict: Statistics including kick count, timeout count, etc.
+                Fields are read without a lock, so they may straddle a
+                concurrent kick.
         """
-        with self.lock:
-            current_time = time.time()
-            return {
-                'enabled': self.enabled,
-                'healthy': self.is_healthy(),
-                'time_since_response': current_time - self.last_response,
-                'time_since_heartbeat': current_time - self.last_heartbeat,
-                'kick_count': self.kick_count,
-                'timeout_count': self.timeout_count,
-                'heartbeat_count': self.heartbeat_count,
-                'fault_detected': self.fault_detected
-            }
+        current_time = time.monotonic()
+        time_since_response = current_time - self.last_response
+        return {
+            'enabled': self.enabled,
+            'healthy': time_since_response < self.timeout,
+            'time_since_response': time_since_response,
+            'time_since_heartbeat': current_time - self.last_heartbeat,
+            'kick_count': self.kick_count,
+            'timeout_count': self.timeout_count,
+            'heartbeat_count': self.heartbeat_count,
+            'fault_detected': self.fault_detected
+        }
     
     def set_timeout(self, timeout):
         """
@@ -233,9 +305,9 @@ class Watchdog:
         Args:
             timeout: New timeout in seconds
         """
-        with self.lock:
-            self.timeout = timeout
-            print(f"⚙ Watchdog: Timeout set to {timeout}s")
+        self.timeout = timeout
+        self._fast_threshold = timeout * 0.5
+        logger.info("⚙ Watchdog: Timeout set to %ss", timeout)
     
     def __repr__(self):
         """String representation for debugging."""
@@ -245,6 +317,8 @@ class Watchdog:
 
 # Testing
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     print("Watchdog Test")
     print("=" * 50)
     
@@ -7,40 +7,54 @@ It falls back to non-package imports when necessary so running as a script
 may still work depending on your PYTHONPATH / current working directory.
 """
 
+import os
 import sys
+from pathlib import Path
+
+# Project root (parent of this package), resolved once at import
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+
+# MainWindow class once resolved - later calls return it directly
+_MAIN_WINDOW_CLS = None
+
 
 def import_mainwindow():
+    global _MAIN_WINDOW_CLS
+    if _MAIN_WINDOW_CLS is not None:
+        return _MAIN_WINDOW_CLS
+    
+    debug = bool(os.environ.get("C2C_DEBUG"))
+    
     try:
         from C2C.ui.main_window import MainWindow
-        return MainWindow
     except Exception:
-        # Print the original traceback for debugging, then try package/absolute
-        # fallbacks. This helps when the module is executed as a script rather
-        # than a package (so relative imports fail).
-        import traceback
-        traceback.print_exc()
+        # Print the original traceback for debugging (set C2C_DEBUG=1), then
+        # try package/absolute fallbacks. This helps when the module is
+        # executed as a script rather than a package (so relative imports fail).
+        if debug:
+            import traceback
+            traceback.print_exc()
         # Ensure the project root (parent of this package) is on sys.path so
         # absolute import `C2C.ui.main_window` can succeed when this file is
         # executed as a script from the `C2C/` directory.
-        try:
-            from pathlib import Path
-            project_root = Path(__file__).resolve().parent.parent
-            if str(project_root) not in sys.path:
-                sys.path.insert(0, str(project_root))
-        except Exception:
-            pass
+        if _PROJECT_ROOT not in sys.path:
+            sys.path.insert(0, _PROJECT_ROOT)
 
         # Try relative import
         try:
             from .ui.main_window import MainWindow
-            return MainWindow
         except Exception:
+            if debug:
+                import traceback
+                traceback.print_exc()
             # Try top-level (non-package) import as a last resort
             try:
                 from ui.main_window import MainWindow
-                return MainWindow
             except Exception as e:
                 raise ImportError("Failed to import MainWindow from UI module") from e
+    
+    _MAIN_WINDOW_CLS = MainWindow
+    return MainWindow
 
 
 def main():
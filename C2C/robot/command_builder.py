@@ -16,10 +16,89 @@ J3:45
 SPD:30
 TIME:100
 $
+
+Commands are produced as ASCII bytes, the form the serial link writes,
+so nothing on the send path re-encodes them. Use as_str() to log or
+print one.
 """
 
+import io
+import warnings
+from collections import namedtuple
+from functools import lru_cache
+
+__all__ = [
+    'MoveFrame',
+    'generate_move_command',
+    'generate_move_command_str',
+    'rounded_angles',
+    'format_move_frame',
+    'format_joint_lines',
+    'format_move_tail',
+    'generate_stop_command',
+    'generate_home_command',
+    'generate_status_request',
+    'as_str',
+    'validate_command',
+    'parse_command_log',
+    'iter_commands',
+    'format_command_for_display',
+]
+
+# A generated MOVE frame together with the values it was built from, so
+# it can be displayed without parsing the wire bytes back.
+#   wire: encoded frame (bytes), joints: tuple of int angles (J1 first),
+#   speed/time: ints, weld: "ON", "OFF" or None
+MoveFrame = namedtuple('MoveFrame', 'wire joints speed time weld')
+
+# Pre-encoded MOVE frame templates, keyed by (joint count, weld state).
+# Each has one %d per joint, then SPD and TIME, so a frame is one format.
+_MOVE_TEMPLATES = {}
+_JOINT_PREFIXES = [b"J%d:" % i for i in range(1, 17)]
+_WELD_LINES = {"ON": b"WELD:ON\n", "OFF": b"WELD:OFF\n", None: b""}
+
+# Validation flags collected in validate_command's single pass
+_HAS_JOINT = 1
+_HAS_SPEED = 2
+_HAS_TIME = 4
+
+# Non-MOVE command names -> parsed 'type'
+_SIMPLE_TYPES = {b"STOP": "STOP", b"HOME": "HOME", b"STATUS?": "STATUS?"}
+
+
+def _move_template(joint_count, weld_state):
+    """
+    Get (building once) the bytes template for a MOVE frame.
+    
+    Internal helper function.
+    """
+    key = (joint_count, weld_state)
+    template = _MOVE_TEMPLATES.get(key)
+    if template is None:
+        joints = b"".join(
+            (_JOINT_PREFIXES[i] if i < 16 else b"J%d:" % (i + 1)) + b"%d\n"
+            for i in range(joint_count)
+        )
+        template = b"$MOVE\n" + joints + b"SPD:%d\n" + _WELD_LINES[weld_state] + b"TIME:%d\n$"
+        _MOVE_TEMPLATES[key] = template
+    return template
 
-def generate_move_command(robot_model, speed=30, time_ms=100, weld_state=None):
+
+def _weld_key(weld_state):
+    """
+    Normalize a weld state to "ON", "OFF" or None (not emitted).
+    
+    Internal helper function.
+    """
+    if weld_state:
+        weld_state = str(weld_state).upper()
+        if weld_state in _WELD_LINES:
+            return weld_state
+    return None
+
+
+def generate_move_command(robot_model, speed=30, time_ms=100, weld_state=None,
+                          return_struct=False):
     """
     Generate ESP32-compatible MOVE command from current robot state.
     
@@ -28,15 +107,18 @@ def generate_move_command(robot_model, speed=30, time_ms=100, weld_state=None):
         speed: Movement speed (0-100)
         time_ms: Time to complete movement in milliseconds
         weld_state: Welding state - "ON", "OFF", or None (no welding)
+        return_struct: If True, return a MoveFrame (wire bytes plus the
+            values it was built from)
     
     Returns:
-        str: Formatted command string ready for ESP32
+        bytes: Encoded command ready for ESP32 (MoveFrame if
+            return_struct), or None if the robot has no links
     
     Example:
         >>> robot = RobotModel()
         >>> robot.links = [Link(...), Link(...)]
         >>> cmd = generate_move_command(robot, speed=30, time_ms=100)
-        >>> print(cmd)
+        >>> print(as_str(cmd))
         $MOVE
         J1:90
         J2:120
@@ -46,7 +128,7 @@ def generate_move_command(robot_model, speed=30, time_ms=100, weld_state=None):
         
         >>> # With welding
         >>> cmd = generate_move_command(robot, speed=30, time_ms=100, weld_state="ON")
-        >>> print(cmd)
+        >>> print(as_str(cmd))
         $MOVE
         J1:90
         J2:120
@@ -58,31 +140,110 @@ def generate_move_command(robot_model, speed=30, time_ms=100, weld_state=None):
     if not robot_model.links:
         return None
     
-    lines = ["$MOVE"]
+    # Joint angles rounded to integers - ESP32 doesn't need sub-degree precision
+    # (RobotModel keeps them rounded in one array; other models per link)
+    model_angles = getattr(robot_model, 'rounded_angles', None)
+    joints = tuple(model_angles() if model_angles is not None
+                   else rounded_angles(robot_model.links))
+    frame = format_move_frame(joints, speed, time_ms, weld_state)
     
-    # Add joint angles (convert to integers for ESP32)
-    for i, link in enumerate(robot_model.links):
-        # Round to nearest integer - ESP32 doesn't need sub-degree precision
-        angle = int(round(link.angle))
-        lines.append(f"J{i+1}:{angle}")
+    if return_struct:
+        return MoveFrame(frame, joints, int(speed), int(time_ms), _weld_key(weld_state))
+    return frame
+
+
+def generate_move_command_str(robot_model, speed=30, time_ms=100, weld_state=None):
+    """
+    generate_move_command returning str, for callers not yet on bytes.
     
-    # Add speed
-    lines.append(f"SPD:{int(speed)}")
+    Deprecated: use generate_move_command (and as_str() for display).
     
-    # Add welding state (if specified)
-    # CRITICAL: WELD must come BEFORE TIME in command structure
-    if weld_state:
-        weld_state = str(weld_state).upper()
-        if weld_state in ["ON", "OFF"]:
-            lines.append(f"WELD:{weld_state}")
+    Returns:
+        str: Formatted command string, or None if the robot has no links
+    """
+    warnings.warn("generate_move_command_str is deprecated; use generate_move_command",
+                  DeprecationWarning, stacklevel=2)
+    return as_str(generate_move_command(robot_model, speed, time_ms, weld_state))
+
+
+def rounded_angles(links):
+    """
+    Whole-degree angle of each link, as sent in MOVE frames.
     
-    # Add time
-    lines.append(f"TIME:{int(time_ms)}")
+    Link keeps its angle pre-rounded (updated whenever the angle is
+    set), so this is a plain property read per link. Link-like objects
+    without it are rounded here.
     
-    # End marker
-    lines.append("$")
+    Args:
+        links: Sequence of Link objects
     
-    return "\n".join(lines)
+    Returns:
+        list: Integer angles, J1 first
+    """
+    try:
+        return [link.angle_int for link in links]
+    except AttributeError:
+        return [int(round(link.angle)) for link in links]
+
+
+def format_move_frame(angles, speed, time_ms, weld_state=None):
+    """
+    Format a MOVE frame from integer joint angles.
+    
+    The building block of generate_move_command, for callers that hold
+    angles in bulk (e.g. a whole weld path) rather than in a robot model.
+    
+    Args:
+        angles: Sequence of integer angles, J1 first
+        speed: Movement speed (0-100)
+        time_ms: Time to complete movement in milliseconds
+        weld_state: Welding state - "ON", "OFF", or None (no welding)
+    
+    Returns:
+        bytes: Encoded frame, without a trailing newline
+    """
+    # Welding state (if specified) - only ON/OFF are emitted
+    # CRITICAL: WELD must come BEFORE TIME in command structure (see template)
+    template = _move_template(len(angles), _weld_key(weld_state))
+    
+    # Angles, speed and time all filled in one bytes format
+    return template % (*angles, int(speed), int(time_ms))
+
+
+def format_joint_lines(angles, first_joint=1):
+    """
+    Format the joint lines of a MOVE frame ("J1:90\\n..." as bytes).
+    
+    With b"$MOVE\\n" in front and format_move_tail() behind, this builds a
+    frame in pieces, so frames sharing a pose can share the joint part.
+    
+    Args:
+        angles: Sequence of integer angles
+        first_joint: Joint number of angles[0]
+    
+    Returns:
+        bytes: One "Jn:angle\\n" line per angle
+    """
+    return b"".join([b"J%d:%d\n" % (joint, angle)
+                     for joint, angle in enumerate(angles, first_joint)])
+
+
+@lru_cache(maxsize=64)
+def format_move_tail(speed, time_ms, weld_state=None):
+    """
+    Format the part of a MOVE frame after the joints (SPD, WELD, TIME, $).
+    
+    Cached - sequences reuse a handful of (speed, time, weld) settings.
+    
+    Args:
+        speed: Movement speed (0-100)
+        time_ms: Time to complete movement in milliseconds
+        weld_state: Welding state - "ON", "OFF", or None (no welding)
+    
+    Returns:
+        bytes: Encoded tail, without a trailing newline
+    """
+    return format_move_frame((), speed, time_ms, weld_state)[len(b"$MOVE\n"):]
 
 
 def generate_stop_command():
@@ -90,14 +251,14 @@ def generate_stop_command():
     Generate emergency stop command.
     
     Returns:
-        str: Emergency stop command
+        bytes: Emergency stop command
     
     Example:
         >>> cmd = generate_stop_command()
-        >>> print(cmd)
+        >>> print(as_str(cmd))
         $STOP$
     """
-    return "$STOP$"
+    return b"$STOP$"
 
 
 def generate_home_command():
@@ -105,14 +266,14 @@ def generate_home_command():
     Generate home position command (all joints to safe position).
     
     Returns:
-        str: Home command
+        bytes: Home command
     
     Example:
         >>> cmd = generate_home_command()
-        >>> print(cmd)
+        >>> print(as_str(cmd))
         $HOME$
     """
-    return "$HOME$"
+    return b"$HOME$"
 
 
 def generate_status_request():
@@ -120,14 +281,34 @@ def generate_status_request():
     Generate status request command.
     
     Returns:
-        str: Status request command
+        bytes: Status request command
     
     Example:
         >>> cmd = generate_status_request()
-        >>> print(cmd)
+        >>> print(as_str(cmd))
         $STATUS?$
     """
-    return "$STATUS?$"
+    return b"$STATUS?$"
+
+
+def as_str(command):
+    """
+    Command as text, for logging and display.
+    
+    Args:
+        command: Command bytes (str and None pass through)
+    
+    Returns:
+        str: Decoded command
+    """
+    if isinstance(command, (bytes, bytearray, memoryview)):
+        return bytes(command).decode('ascii', errors='replace')
+    return command
+
+
+def _as_bytes(text):
+    """Encode str input; bytes pass through. Internal helper function."""
+    return text.encode('utf-8') if isinstance(text, str) else text
 
 
 def validate_command(command_string):
@@ -135,7 +316,7 @@ def validate_command(command_string):
     Validate that command string follows ESP32 protocol.
     
     Args:
-        command_string: Command to validate
+        command_string: Command to validate (str or bytes)
     
     Returns:
         tuple: (bool: is_valid, str: error_message or None)
@@ -148,33 +329,40 @@ def validate_command(command_string):
     if not command_string:
         return False, "Command is empty"
     
+    buf = _as_bytes(command_string)
+    
     # Check start marker
-    if not command_string.startswith("$"):
+    if buf[:1] != b"$":
         return False, "Command must start with $"
     
     # Check end marker
-    if not command_string.endswith("$"):
+    if buf[-1:] != b"$":
         return False, "Command must end with $"
     
-    # For MOVE commands, verify structure
-    if "$MOVE" in command_string:
-        lines = command_string.strip().split("\n")
+    # For MOVE commands, verify structure - one pass collecting flags
+    if b"$MOVE" in buf:
+        lines = buf.strip().split(b"\n")
         
         if len(lines) < 3:
             return False, "MOVE command too short"
         
+        flags = 0
+        for line in lines:
+            if line[:1] == b"J":
+                flags |= _HAS_JOINT
+            elif line.startswith(b"SPD:"):
+                flags |= _HAS_SPEED
+            elif line.startswith(b"TIME:"):
+                flags |= _HAS_TIME
+        
         # Check for at least one joint
-        has_joint = any(line.startswith("J") for line in lines)
-        if not has_joint:
+        if not flags & _HAS_JOINT:
             return False, "MOVE command must have at least one joint"
         
         # Check for required parameters
-        has_speed = any(line.startswith("SPD:") for line in lines)
-        has_time = any(line.startswith("TIME:") for line in lines)
-        
-        if not has_speed:
+        if not flags & _HAS_SPEED:
             return False, "MOVE command must have SPD parameter"
-        if not has_time:
+        if not flags & _HAS_TIME:
             return False, "MOVE command must have TIME parameter"
     
     return True, None
@@ -185,7 +373,7 @@ def parse_command_log(log_text):
     Parse a log of commands to extract motion sequence.
     
     Args:
-        log_text: Multi-line string of logged commands
+        log_text: Multi-line string (or bytes) of logged commands
     
     Returns:
         list: List of parsed command dictionaries
@@ -196,81 +384,133 @@ def parse_command_log(log_text):
         >>> print(commands[0])
         {'type': 'MOVE', 'joints': {1: 90, 2: 120}, 'speed': 30, 'time': 100}
     """
-    commands = []
-    current_command = []
+    return list(iter_commands(log_text))
+
+
+def iter_commands(source):
+    """
+    Parse logged commands one at a time, as the log is read.
     
-    for line in log_text.split("\n"):
+    Single pass over the lines: each one is applied straight to the
+    command being built, with no per-command re-join and re-split, and
+    the lines are never collected into a list - a long session log (or
+    an open log file) is replayed in constant memory.
+    
+    Args:
+        source: Log text (str or bytes), or a file object opened in
+            binary or text mode
+    
+    Yields:
+        dict: One parsed command per terminated command, in log order
+    """
+    if isinstance(source, (str, bytes, bytearray, memoryview)):
+        lines = io.BytesIO(_as_bytes(source))
+    elif isinstance(source, io.TextIOBase):
+        lines = (line.encode('utf-8') for line in source)
+    else:
+        lines = source
+    
+    # State: idle (current is None), or inside a command. move is the
+    # command dict while its body lines are being parsed, None otherwise.
+    # A malformed body line only raises once its command is terminated,
+    # since unterminated commands are never parsed.
+    current = None
+    move = None
+    error = None
+    
+    for line in lines:
         line = line.strip()
+        if not line:
+            continue
         
-        if line.startswith("$") and line != "$":
-            # Start of command
-            current_command = [line]
-        elif line == "$":
-            # End of command
-            current_command.append(line)
-            # Parse the command
-            cmd = _parse_single_command("\n".join(current_command))
-            if cmd:
-                commands.append(cmd)
-            current_command = []
-        elif current_command:
+        if line[0] == 0x24:  # '$'
+            if line == b"$":
+                # End of command
+                if error is not None:
+                    raise error
+                if current is not None:
+                    yield current
+                current = move = None
+            else:
+                # Start of command
+                current = _new_command(line)
+                move = current if current is not None and current['type'] == 'MOVE' else None
+                error = None
+        elif move is not None:
             # Middle of command
-            current_command.append(line)
-    
-    return commands
+            try:
+                _parse_move_line(line, move)
+            except ValueError as e:
+                error = e
+                move = None
 
 
-def _parse_single_command(command_string):
+def _new_command(header):
     """
-    Parse a single command string into dictionary.
+    Start a command dictionary from its header line (e.g. b"$MOVE").
     
     Internal helper function.
     """
-    lines = command_string.strip().split("\n")
+    cmd_type = header.replace(b"$", b"").strip()
     
-    if not lines:
-        return None
-    
-    cmd_type = lines[0].replace("$", "").strip()
-    
-    if cmd_type == "MOVE":
-        cmd = {
+    if cmd_type == b"MOVE":
+        return {
             'type': 'MOVE',
             'joints': {},
             'speed': None,
             'time': None,
             'weld': None
         }
-        
-        for line in lines[1:-1]:  # Skip first and last ($)
-            if line.startswith("J"):
-                # Parse joint: J1:90
-                parts = line.split(":")
-                if len(parts) == 2:
-                    joint_num = int(parts[0][1:])  # Remove 'J'
-                    angle = int(parts[1])
-                    cmd['joints'][joint_num] = angle
-            elif line.startswith("SPD:"):
-                cmd['speed'] = int(line.split(":")[1])
-            elif line.startswith("WELD:"):
-                cmd['weld'] = line.split(":")[1]
-            elif line.startswith("TIME:"):
-                cmd['time'] = int(line.split(":")[1])
-        
-        return cmd
     
-    elif cmd_type in ["STOP", "HOME", "STATUS?"]:
-        return {'type': cmd_type}
+    simple = _SIMPLE_TYPES.get(cmd_type)
+    if simple is not None:
+        return {'type': simple}
     
     return None
 
 
+def _parse_move_line(line, cmd):
+    """
+    Apply one body line of a MOVE frame to its command dictionary.
+    
+    Internal helper function.
+    """
+    if line[:1] == b"J":
+        # Parse joint: J1:90 (exactly one ':')
+        joint, sep, angle = line.partition(b":")
+        if sep and b":" not in angle:
+            cmd['joints'][int(joint[1:])] = int(angle)
+    elif line.startswith(b"SPD:"):
+        cmd['speed'] = int(line[4:].partition(b":")[0])
+    elif line.startswith(b"WELD:"):
+        cmd['weld'] = line[5:].partition(b":")[0].decode('utf-8', errors='replace')
+    elif line.startswith(b"TIME:"):
+        cmd['time'] = int(line[5:].partition(b":")[0])
+
+
+def _parse_single_command(command_string):
+    """
+    Parse a single command string into dictionary.
+    
+    Internal helper function.
+    """
+    lines = _as_bytes(command_string).strip().split(b"\n")
+    
+    cmd = _new_command(lines[0])
+    if cmd is not None and cmd['type'] == 'MOVE':
+        for line in lines[1:-1]:  # Skip first and last ($)
+            _parse_move_line(line, cmd)
+    
+    return cmd
+
+
 def format_command_for_display(command_string):
     """
     Format command string for human-readable display.
     
     Args:
-        command_string: Raw command string
+        command_string: Raw command string (or bytes), or a MoveFrame -
+            which is formatted directly, without parsing
     
     Returns:
         str: Formatted display string
@@ -284,22 +524,20 @@ def format_command_for_display(command_string):
            Speed: 30
            Time: 100ms
     """
+    if isinstance(command_string, MoveFrame):
+        frame = command_string
+        return _format_move_display(enumerate(frame.joints, 1), frame.speed, frame.weld, frame.time)
+    
     parsed = _parse_single_command(command_string)
     
     if not parsed:
-        return command_string
+        return as_str(command_string)
     
     if parsed['type'] == 'MOVE':
-        lines = [f"📤 MOVE Command:"]
-        for joint_num in sorted(parsed['joints'].keys()):
-            angle = parsed['joints'][joint_num]
-            lines.append(f"   Joint {joint_num} → {angle}°")
-        lines.append(f"   Speed: {parsed['speed']}")
-        if parsed.get('weld'):
-            weld_icon = "🔥" if parsed['weld'] == "ON" else "❄"
-            lines.append(f"   {weld_icon} Weld: {parsed['weld']}")
-        lines.append(f"   Time: {parsed['time']}ms")
-        return "\n".join(lines)
+        joints = parsed['joints']
+        return _format_move_display(
+            ((joint_num, joints[joint_num]) for joint_num in sorted(joints.keys())),
+            parsed['speed'], parsed.get('weld'), parsed['time'])
     
     elif parsed['type'] == 'STOP':
         return "🚨 EMERGENCY STOP Command"
@@ -310,7 +548,24 @@ def format_command_for_display(command_string):
     elif parsed['type'] == 'STATUS?':
         return "❓ STATUS Request"
     
-    return command_string
+    return as_str(command_string)
+
+
+def _format_move_display(joints, speed, weld, time_ms):
+    """
+    Display text for a MOVE frame.
+    
+    Internal helper function.
+    """
+    lines = [f"📤 MOVE Command:"]
+    for joint_num, angle in joints:
+        lines.append(f"   Joint {joint_num} → {angle}°")
+    lines.append(f"   Speed: {speed}")
+    if weld:
+        weld_icon = "🔥" if weld == "ON" else "❄"
+        lines.append(f"   {weld_icon} Weld: {weld}")
+    lines.append(f"   Time: {time_ms}ms")
+    return "\n".join(lines)
 
 
 # Export validation
@@ -331,7 +586,7 @@ if __name__ == "__main__":
     robot = MockRobot()
     cmd = generate_move_command(robot, speed=30, time_ms=100)
     print("Generated Command:")
-    print(cmd)
+    print(as_str(cmd))
     print()
     
     # Validate
@@ -347,7 +602,7 @@ if __name__ == "__main__":
     
     # Test emergency stop
     stop_cmd = generate_stop_command()
-    print(f"Stop Command: {stop_cmd}")
+    print(f"Stop Command: {as_str(stop_cmd)}")
     print()
     
     # Parse
@@ -1,57 +1,203 @@
 import math
+
 import numpy as np
 
-def forward_kinematics(links):
+# Rotation axis letter -> code used in the per-link axes array
+_AXIS_CODES = {'X': 0, 'Y': 1, 'Z': 2}
+
+# Axis rotations, per axis code (post-multiplying R mixes two columns):
+#   X: [[1,0,0],[0,c,-s],[0,s,c]]   Y: [[c,0,s],[0,1,0],[-s,0,c]]
+#   Z: [[c,-s,0],[s,c,0],[0,0,1]]
+
+# cos/sin of every whole degree 0..359, one (cos, sin) row per degree.
+# Whole-degree angles are looked up (mod 360) instead of evaluated.
+_COS_SIN = np.stack([np.cos(np.deg2rad(np.arange(360))),
+                     np.sin(np.deg2rad(np.arange(360)))], axis=1)
+
+# Same factor np.deg2rad uses, for the scalar chain
+_DEG2RAD = math.pi / 180
+
+# Set False to always evaluate cos/sin (e.g. to compare results in tests)
+use_lut = True
+
+# Below this many angles np.cos/np.sin beat the lookup - the integer check
+# and gather cost more than the transcendentals (crossover ~150 on x86-64)
+_LUT_MIN_SIZE = 128
+
+
+def link_arrays(links):
+    """
+    Pack the fixed part of each link (axis, length) into arrays.
+
+    Args:
+        links: Sequence of Link objects
+
+    Returns:
+        tuple: (axes, lengths) - int8 axis codes (0=X, 1=Y, 2=Z) and
+            float64 lengths, one entry per link
+    """
+    n = len(links)
+    axes = np.fromiter((_AXIS_CODES.get(link.rotation_axis, 2) for link in links),
+                       dtype=np.int8, count=n)
+    lengths = np.fromiter((link.length for link in links), dtype=np.float64, count=n)
+    return axes, lengths
+
+
+def cos_sin(angles_deg):
+    """
+    cos and sin of an array of angles in degrees.
+
+    Uses the whole-degree table when every angle is a whole number and
+    the batch is large enough for the lookup to pay off.
+
+    Args:
+        angles_deg: float64 ndarray of angles (degrees)
+
+    Returns:
+        tuple: (cos, sin) arrays shaped like angles_deg
+    """
+    if use_lut and angles_deg.size >= _LUT_MIN_SIZE:
+        whole = angles_deg.astype(np.intp)
+        if not (angles_deg - whole).any():
+            cs = _COS_SIN.take(whole, axis=0, mode='wrap')
+            return cs[..., 0], cs[..., 1]
+
+    rad = np.deg2rad(angles_deg)
+    return np.cos(rad), np.sin(rad)
+
+
+def _chain(axes, lengths, angles):
+    """
+    Walk the link chain carrying a 3x3 rotation R and position t.
+
+    The bottom row of a homogeneous transform is always [0, 0, 0, 1], so
+    4x4 products are not needed: each link post-multiplies R by its axis
+    rotation - which only mixes two columns of R - then moves its length
+    along the rotated Z-axis (t += R[:, 2] * length).
+
+    cos/sin are taken per joint with math: for one pose that is cheaper
+    than ufunc calls and their temporary arrays at any realistic joint
+    count.
+
+    Args:
+        axes, lengths, angles: Per-link Python lists (angles in degrees)
+
+    Returns:
+        list: (x, y, z) per link, base excluded
+    """
+    cos = math.cos
+    sin = math.sin
+    r00, r01, r02 = 1.0, 0.0, 0.0
+    r10, r11, r12 = 0.0, 1.0, 0.0
+    r20, r21, r22 = 0.0, 0.0, 1.0
+    x = y = z = 0.0
+    points = []
+
+    for ax, length, a in zip(axes, lengths, angles):
+        a *= _DEG2RAD
+        c = cos(a)
+        s = sin(a)
+        if ax == 0:    # X: columns 1, 2
+            r01, r02 = r01 * c + r02 * s, r02 * c - r01 * s
+            r11, r12 = r11 * c + r12 * s, r12 * c - r11 * s
+            r21, r22 = r21 * c + r22 * s, r22 * c - r21 * s
+        elif ax == 1:  # Y: columns 0, 2
+            r00, r02 = r00 * c - r02 * s, r00 * s + r02 * c
+            r10, r12 = r10 * c - r12 * s, r10 * s + r12 * c
+            r20, r22 = r20 * c - r22 * s, r20 * s + r22 * c
+        else:          # Z: columns 0, 1
+            r00, r01 = r00 * c + r01 * s, r01 * c - r00 * s
+            r10, r11 = r10 * c + r11 * s, r11 * c - r10 * s
+            r20, r21 = r20 * c + r21 * s, r21 * c - r20 * s
+
+        x += r02 * length
+        y += r12 * length
+        z += r22 * length
+        points.append((x, y, z))
+
+    return points
+
+
+def forward_kinematics(links, axes=None, lengths=None, angles=None):
     """
     Calculate forward kinematics for robot arm.
     All joints start vertically along Z-axis.
     Each joint can rotate around X, Y, or Z axis.
+
+    The whole chain, trig included, is the scalar 3x3 rotation +
+    translation walk in _chain(); NumPy is only used for the result.
+
+    Args:
+        links: Sequence of Link objects (not read at all when axes,
+            lengths and angles are all given)
+        axes: Optional int8 axis codes from link_arrays()
+        lengths: Optional float64 lengths from link_arrays()
+        angles: Optional float64 joint angles (degrees), one per link
+
+    Returns:
+        ndarray: (N+1, 3) joint positions, base (0, 0, 0) first. Rows
+            unpack like (x, y, z) tuples; use .tolist() for plain lists.
     """
-    points = [(0, 0, 0)]
-    
-    # Current transformation matrix (identity)
-    transform = np.eye(4)
-    
-    for link in links:
-        # Rotation angle in radians
-        angle_rad = math.radians(link.angle)
-        
-        # Create rotation matrix based on rotation axis
-        if link.rotation_axis == 'X':
-            rotation = np.array([
-                [1, 0, 0, 0],
-                [0, math.cos(angle_rad), -math.sin(angle_rad), 0],
-                [0, math.sin(angle_rad), math.cos(angle_rad), 0],
-                [0, 0, 0, 1]
-            ])
-        elif link.rotation_axis == 'Y':
-            rotation = np.array([
-                [math.cos(angle_rad), 0, math.sin(angle_rad), 0],
-                [0, 1, 0, 0],
-                [-math.sin(angle_rad), 0, math.cos(angle_rad), 0],
-                [0, 0, 0, 1]
-            ])
-        else:  # Z-axis (default)
-            rotation = np.array([
-                [math.cos(angle_rad), -math.sin(angle_rad), 0, 0],
-                [math.sin(angle_rad), math.cos(angle_rad), 0, 0],
-                [0, 0, 1, 0],
-                [0, 0, 0, 1]
-            ])
-        
-        # Translation along local Z-axis (joint is vertical)
-        translation = np.array([
-            [1, 0, 0, 0],
-            [0, 1, 0, 0],
-            [0, 0, 1, link.length],
-            [0, 0, 0, 1]
-        ])
-        
-        # Apply rotation first, then translation
-        transform = transform @ rotation @ translation
-        
-        # Extract position
-        x, y, z = transform[0, 3], transform[1, 3], transform[2, 3]
-        points.append((x, y, z))
-    
+    n = len(links)
+    points = np.zeros((n + 1, 3))
+    if n == 0:
+        return points
+
+    if axes is None or lengths is None:
+        axes, lengths = link_arrays(links)
+
+    if angles is None:
+        angles = [link.angle for link in links]
+    else:
+        angles = angles.tolist()
+
+    points[1:] = _chain(axes.tolist(), lengths.tolist(), angles)
+    return points
+
+
+def forward_kinematics_batch(angles, axes, lengths):
+    """
+    Forward kinematics for many poses of the same arm at once.
+
+    Same 3x3 rotation + translation chain as forward_kinematics,
+    vectorized over the poses: the Python loop runs once per link, not
+    once per link per pose.
+
+    Args:
+        angles: (N, J) joint angles in degrees, one row per pose
+        axes: int8 axis codes from link_arrays() (J,)
+        lengths: float64 lengths from link_arrays() (J,)
+
+    Returns:
+        ndarray: (N, J+1, 3) joint positions per pose, base first
+    """
+    angles = np.asarray(angles, dtype=np.float64)
+    count, n = angles.shape
+    points = np.zeros((count, n + 1, 3))
+    if n == 0 or count == 0:
+        return points
+
+    c, s = cos_sin(angles)
+
+    # Running 3x3 rotation and position for every pose; per link only the
+    # two columns its axis mixes are updated (see _chain)
+    rot = np.broadcast_to(np.eye(3), (count, 3, 3)).copy()
+    pos = np.zeros((count, 3))
+    for i, (ax, length) in enumerate(zip(axes.tolist(), lengths.tolist())):
+        ci = c[:, i, None]
+        si = s[:, i, None]
+        if ax == 0:    # X: columns 1, 2
+            a, b = 1, 2
+        elif ax == 1:  # Y: columns 2, 0 (sign flipped vs X/Z)
+            a, b = 2, 0
+        else:          # Z: columns 0, 1
+            a, b = 0, 1
+        col_a = rot[:, :, a].copy()
+        col_b = rot[:, :, b]
+        rot[:, :, a] = col_a * ci + col_b * si
+        rot[:, :, b] = col_b * ci - col_a * si
+
+        pos += rot[:, :, 2] * length
+        points[:, i + 1] = pos
+
     return points
@@ -0,0 +1,145 @@
+"""
+Numba-compiled forward kinematics (optional).
+
+Same result as fk.forward_kinematics_batch, compiled to a native loop
+that runs the poses in parallel, plus a serial build of the same loop
+for the single pose of long arms. Only used when numba is installed:
+
+    pip install numba
+
+Without it NUMBA_AVAILABLE is False and callers use the NumPy version.
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+def _fk_batch_loop(angles, axes, lengths, points):
+    """
+    Fill points[p, i + 1] with joint i's position for every pose p.
+
+    Keeps a 3x3 rotation and a position per pose instead of 4x4
+    matrices: each link post-multiplies the rotation, then moves its
+    length along the rotated Z-axis.
+    """
+    count, n = angles.shape
+    for p in prange(count):
+        # Running rotation (r00..r22) and position (x, y, z)
+        r00, r01, r02 = 1.0, 0.0, 0.0
+        r10, r11, r12 = 0.0, 1.0, 0.0
+        r20, r21, r22 = 0.0, 0.0, 1.0
+        x = 0.0
+        y = 0.0
+        z = 0.0
+
+        for i in range(n):
+            rad = math.radians(angles[p, i])
+            c = math.cos(rad)
+            s = math.sin(rad)
+            ax = axes[i]
+
+            if ax == 0:    # X: [[1,0,0],[0,c,-s],[0,s,c]]
+                r01, r02 = r01 * c + r02 * s, r02 * c - r01 * s
+                r11, r12 = r11 * c + r12 * s, r12 * c - r11 * s
+                r21, r22 = r21 * c + r22 * s, r22 * c - r21 * s
+            elif ax == 1:  # Y: [[c,0,s],[0,1,0],[-s,0,c]]
+                r00, r02 = r00 * c - r02 * s, r00 * s + r02 * c
+                r10, r12 = r10 * c - r12 * s, r10 * s + r12 * c
+                r20, r22 = r20 * c - r22 * s, r20 * s + r22 * c
+            else:          # Z: [[c,-s,0],[s,c,0],[0,0,1]]
+                r00, r01 = r00 * c + r01 * s, r01 * c - r00 * s
+                r10, r11 = r10 * c + r11 * s, r11 * c - r10 * s
+                r20, r21 = r20 * c + r21 * s, r21 * c - r20 * s
+
+            length = lengths[i]
+            x += r02 * length
+            y += r12 * length
+            z += r22 * length
+            points[p, i + 1, 0] = x
+            points[p, i + 1, 1] = y
+            points[p, i + 1, 2] = z
+
+
+if njit is not None:
+    _fk_batch_kernel = njit(cache=True, fastmath=True, parallel=True)(_fk_batch_loop)
+    # One pose has nothing to run in parallel - same loop, serial, and
+    # without fastmath (strict IEEE math, like fk.forward_kinematics)
+    _fk_pose_kernel = njit(cache=True)(_fk_batch_loop)
+else:
+    _fk_batch_kernel = None
+    _fk_pose_kernel = None
+
+NUMBA_AVAILABLE = _fk_batch_kernel is not None
+
+# Below this many links the pure-Python chain in fk.forward_kinematics is
+# as quick as a call into the kernel (dispatch and array setup dominate)
+POSE_MIN_LINKS = 16
+
+
+def forward_kinematics_batch(angles, axes, lengths):
+    """
+    Forward kinematics for many poses of the same arm (numba kernel).
+
+    Args:
+        angles: (N, J) joint angles in degrees, one row per pose
+        axes: int8 axis codes from fk.link_arrays() (J,)
+        lengths: float64 lengths from fk.link_arrays() (J,)
+
+    Returns:
+        ndarray: (N, J+1, 3) joint positions per pose, base first
+    
+    Raises:
+        RuntimeError: If numba is not installed
+    """
+    if _fk_batch_kernel is None:
+        raise RuntimeError("numba is not installed - use fk.forward_kinematics_batch")
+
+    angles = np.ascontiguousarray(angles, dtype=np.float64)
+    points = np.zeros((angles.shape[0], angles.shape[1] + 1, 3))
+    _fk_batch_kernel(angles, axes, lengths, points)
+    return points
+
+
+def forward_kinematics_pose(angles, axes, lengths):
+    """
+    Forward kinematics for one pose (numba kernel).
+
+    Args:
+        angles: float64 joint angles in degrees (J,)
+        axes: int8 axis codes from fk.link_arrays() (J,)
+        lengths: float64 lengths from fk.link_arrays() (J,)
+
+    Returns:
+        ndarray: (J+1, 3) joint positions, base (0, 0, 0) first
+
+    Raises:
+        RuntimeError: If numba is not installed
+    """
+    if _fk_pose_kernel is None:
+        raise RuntimeError("numba is not installed - use fk.forward_kinematics")
+
+    angles = np.ascontiguousarray(angles, dtype=np.float64)
+    points = np.zeros((1, angles.shape[0] + 1, 3))
+    _fk_pose_kernel(angles.reshape(1, -1), axes, lengths, points)
+    return points[0]
+
+
+def warm_up():
+    """
+    Compile (or load from the on-disk cache) both kernels.
+
+    The first call of a kernel compiles it, which can take many seconds;
+    run this on a background thread at startup so no UI event pays for it.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    axes = np.zeros(1, dtype=np.int8)
+    lengths = np.ones(1)
+    forward_kinematics_pose(np.zeros(1), axes, lengths)
+    forward_kinematics_batch(np.zeros((1, 1)), axes, lengths)
@@ -1,4 +1,21 @@
 import math
+from functools import lru_cache
+
+import numpy as np
+
+
+# Link-pair constants, keyed by the two lengths themselves (links can be
+# edited, so object identity is not a safe key). The workspace is the
+# ring |l1 - l2| <= d <= l1 + l2, kept as squared radii so the reach test
+# needs no sqrt.
+@lru_cache(maxsize=32)
+def _link_pair(l1, l2):
+    # A zero-length link makes 2*l1*l2 zero, which the callers divide
+    # by; ValueError is the one failure IK callers expect
+    if l1 <= 0 or l2 <= 0:
+        raise ValueError("Link lengths must be positive")
+    return l1 * l1, l2 * l2, 2 * l1 * l2, (l1 + l2) ** 2, (l1 - l2) ** 2
+
 
 def inverse_kinematics_xyz(x, y, z, links):
     if len(links) < 2:
@@ -6,13 +23,63 @@ def inverse_kinematics_xyz(x, y, z, links):
 
     l1 = links[0].length
     l2 = links[1].length
+    l1sq, l2sq, two_l1_l2, reach_sq, inner_sq = _link_pair(l1, l2)
 
-    d = math.sqrt(x*x + y*y)
-    if d > (l1 + l2):
+    d2 = x*x + y*y
+    if d2 > reach_sq or d2 < inner_sq:
         raise ValueError("Target unreachable")
 
-    cos2 = (d*d - l1*l1 - l2*l2) / (2*l1*l2)
-    a2 = math.acos(cos2)
-    a1 = math.atan2(y, x) - math.atan2(l2*math.sin(a2), l1 + l2*math.cos(a2))
+    # Clamp so rounding at the edge of the workspace cannot leave [-1, 1]
+    # (plain compares - cheaper than max/min calls here); sin comes from
+    # cos, and a2 from atan2, instead of acos/sin/cos
+    cos2 = (d2 - l1sq - l2sq) / two_l1_l2
+    if cos2 > 1.0:
+        cos2 = 1.0
+    elif cos2 < -1.0:
+        cos2 = -1.0
+    s2 = math.sqrt(1.0 - cos2*cos2)
+    a2 = math.atan2(s2, cos2)
+    a1 = math.atan2(y, x) - math.atan2(l2*s2, l1 + l2*cos2)
 
     return math.degrees(a1), math.degrees(a2), z
+
+
+def inverse_kinematics_xyz_batch(xs, ys, zs, links):
+    """
+    inverse_kinematics_xyz for many targets at once (e.g. a Cartesian path).
+
+    Targets the first two links cannot reach (too far, or closer than
+    |l1 - l2|) come back as NaN instead of raising, so one bad point does
+    not lose the rest of the path.
+
+    Args:
+        xs, ys, zs: Target coordinates, arrays of the same shape
+        links: Sequence of Link objects (first two are used)
+
+    Returns:
+        tuple: (a1, a2, z) - angle arrays in degrees, and zs as an array
+    """
+    if len(links) < 2:
+        raise ValueError("Need minimum 2 joints")
+
+    l1 = links[0].length
+    l2 = links[1].length
+    l1sq, l2sq, two_l1_l2, reach_sq, inner_sq = _link_pair(l1, l2)
+
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    d2 = xs*xs + ys*ys
+    unreachable = (d2 > reach_sq) | (d2 < inner_sq)
+
+    # Same steps as the scalar version
+    cos2 = (d2 - l1sq - l2sq) / two_l1_l2
+    np.clip(cos2, -1.0, 1.0, out=cos2)
+    s2 = np.sqrt(1.0 - cos2*cos2)
+    a2 = np.arctan2(s2, cos2)
+    a1 = np.arctan2(ys, xs) - np.arctan2(l2*s2, l1 + l2*cos2)
+
+    a1 = np.degrees(a1)
+    a2 = np.degrees(a2)
+    a1[unreachable] = np.nan
+    a2[unreachable] = np.nan
+    return a1, a2, np.asarray(zs, dtype=np.float64)
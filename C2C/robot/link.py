@@ -1,16 +1,137 @@
 # Link definition for robot
 
+try:
+    from .fk import _AXIS_CODES
+except ImportError:
+    try:
+        from C2C.robot.fk import _AXIS_CODES
+    except ImportError:
+        from robot.fk import _AXIS_CODES
+
+
 class Link:
+    # Fixed attribute set: no per-instance __dict__, so the attribute
+    # reads and writes behind the properties below are slot accesses
+    __slots__ = ('_owner', '_index', 'motor_type', '_rotation_axis',
+                 '_angle', '_angle_int', '_length', '_min_angle', '_max_angle')
+
     def __init__(self, length, motor_type="servo",
                  min_angle=0, max_angle=180, rotation_axis="Z"):
-        self.length = float(length)
+        self._owner = None  # RobotModel this link was added to
+        self._index = 0     # This link's row in the owner's arrays
+        self.length = length
         self.motor_type = motor_type
         self.min_angle = min_angle
         self.max_angle = max_angle
-        self.rotation_axis = rotation_axis.upper()  # X, Y, or Z
+        self.rotation_axis = rotation_axis  # X, Y, or Z
 
         # Servo centered, stepper starts at 0
         if motor_type == "servo":
             self.angle = (min_angle + max_angle) / 2
         else:
             self.angle = 0
+
+    # Once added to a RobotModel, a link's values live in the model's
+    # per-link arrays (row _index) and these properties read/write that
+    # row; a link on its own keeps them in its attributes. Every geometry
+    # change bumps the owner's pose version, which invalidates its cached
+    # FK points.
+    @property
+    def angle(self):
+        owner = self._owner
+        if owner is None:
+            return self._angle
+        return owner._angles.item(self._index)
+
+    @angle.setter
+    def angle(self, value):
+        owner = self._owner
+        if owner is None:
+            self._angle = value
+            self._angle_int = int(round(value))
+            return
+        # Rounded value first: it is stored as int16 and raises
+        # OverflowError (leaving the link unchanged) if out of range
+        owner._angle_ints[self._index] = int(round(value))
+        owner._angles[self._index] = value
+        owner._pose_version += 1
+
+    @property
+    def angle_int(self):
+        """Whole-degree angle sent to the ESP32, rounded when the angle is set."""
+        owner = self._owner
+        if owner is None:
+            return self._angle_int
+        return owner._angle_ints.item(self._index)
+
+    @property
+    def length(self):
+        owner = self._owner
+        if owner is None:
+            return self._length
+        return owner._lengths.item(self._index)
+
+    @length.setter
+    def length(self, value):
+        value = float(value)
+        owner = self._owner
+        if owner is None:
+            self._length = value
+            return
+        owner._lengths[self._index] = value
+        owner._pose_version += 1
+
+    # The letter stays on the link; the owner keeps its axis code
+    @property
+    def rotation_axis(self):
+        return self._rotation_axis
+
+    @rotation_axis.setter
+    def rotation_axis(self, value):
+        self._rotation_axis = value.upper()
+        owner = self._owner
+        if owner is not None:
+            owner._axes[self._index] = _AXIS_CODES.get(self._rotation_axis, 2)
+            owner._pose_version += 1
+
+    @property
+    def min_angle(self):
+        owner = self._owner
+        if owner is None:
+            return self._min_angle
+        return owner._limits.item(self._index, 0)
+
+    @min_angle.setter
+    def min_angle(self, value):
+        owner = self._owner
+        if owner is None:
+            self._min_angle = value
+        else:
+            owner._limits[self._index, 0] = value
+
+    @property
+    def max_angle(self):
+        owner = self._owner
+        if owner is None:
+            return self._max_angle
+        return owner._limits.item(self._index, 1)
+
+    @max_angle.setter
+    def max_angle(self, value):
+        owner = self._owner
+        if owner is None:
+            self._max_angle = value
+        else:
+            owner._limits[self._index, 1] = value
+
+    def _detach(self):
+        """Copy this link's row back into its own attributes and leave the owner."""
+        owner = self._owner
+        if owner is None:
+            return
+        self._angle = self.angle
+        self._angle_int = self.angle_int
+        self._length = self.length
+        self._min_angle = self.min_angle
+        self._max_angle = self.max_angle
+        self._owner = None
@@ -8,26 +8,225 @@ project_root = Path(__file__).resolve().parent.parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
+import numpy as np
+
 try:
-    from .fk import forward_kinematics
+    from .fk import forward_kinematics, forward_kinematics_batch, _AXIS_CODES
+    from . import fk_numba
 except ImportError:
     try:
-        from C2C.robot.fk import forward_kinematics
+        from C2C.robot.fk import forward_kinematics, forward_kinematics_batch, _AXIS_CODES
+        from C2C.robot import fk_numba
     except ImportError:
-        from robot.fk import forward_kinematics
+        from robot.fk import forward_kinematics, forward_kinematics_batch, _AXIS_CODES
+        from robot import fk_numba
 
 class RobotModel:
     def __init__(self):
         self.links = []
 
+        # Per-link state as parallel arrays, row i belonging to links[i].
+        # Added links read and write their row, so FK and frame building
+        # scan these arrays instead of visiting each Link. Only the first
+        # _count rows are used; capacity doubles as links are added.
+        self._count = 0
+        self._angles = np.zeros(0)                     # degrees
+        self._angle_ints = np.zeros(0, dtype=np.int16) # whole degrees, as sent
+        self._lengths = np.zeros(0)
+        self._axes = np.zeros(0, dtype=np.int8)        # 0=X, 1=Y, 2=Z
+        self._limits = np.zeros((0, 2))                # (min, max) angle
+
+        # FK result, valid while _cached_version == _pose_version. Links
+        # bump _pose_version whenever an angle, length or axis changes.
+        self._pose_version = 0
+        self._cached_points = None
+        self._cached_tool = None  # Last row of _cached_points, as floats
+        self._cached_version = -1
+
     def add_link(self, link):
+        link._detach()
+        row = self._count
+        if row == len(self._angles):
+            self._resize(max(4, 2 * row))
+
+        self._angles[row] = link.angle
+        self._angle_ints[row] = link.angle_int
+        self._lengths[row] = link.length
+        self._axes[row] = _AXIS_CODES.get(link.rotation_axis, 2)
+        self._limits[row] = (link.min_angle, link.max_angle)
+
+        link._owner = self
+        link._index = row
         self.links.append(link)
+        self._count = row + 1
+        self._pose_version += 1
+
+    def remove_link(self, index):
+        """
+        Remove the link at index; later links move up one row.
+
+        Args:
+            index: Position of the link in self.links
+
+        Returns:
+            Link: The removed link, detached (keeps its values)
+        """
+        self._check_links()
+        link = self.links.pop(index)
+        link._detach()
+
+        count = self._count
+        for array in (self._angles, self._angle_ints, self._lengths, self._axes, self._limits):
+            array[index:count - 1] = array[index + 1:count]
+        for row in range(index, count - 1):
+            self.links[row]._index = row
+        self._count = count - 1
+        self._pose_version += 1
+        return link
+
+    def _resize(self, capacity):
+        """Grow the per-link arrays to capacity rows, keeping their contents."""
+        count = self._count
+        for name in ('_angles', '_angle_ints', '_lengths', '_axes', '_limits'):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:count] = old[:count]
+            setattr(self, name, new)
+
+    def _check_links(self):
+        """Re-pack the arrays if self.links was edited as a plain list."""
+        # The UI may still append to / pop from the list directly; a count
+        # change catches that. Detach everything first (each link takes its
+        # values from its old row), then add the links back in order.
+        links = self.links
+        if len(links) == self._count:
+            return
+        for link in links:
+            link._detach()
+        self.links = []
+        self._count = 0
+        for link in links:
+            self.add_link(link)
+
+    @property
+    def pose_version(self):
+        """Counter bumped by every angle, length, axis or link change."""
+        return self._pose_version
+
+    def mark_dirty(self):
+        """Invalidate the cached FK points (e.g. after editing links directly)."""
+        self._pose_version += 1
+
+    def set_angles(self, angles):
+        """
+        Set several joint angles, invalidating the cached pose once.
+
+        Args:
+            angles: Dict of link index -> angle (degrees), or an iterable
+                of (index, angle) pairs; out-of-range indices are ignored
+        """
+        if isinstance(angles, dict):
+            angles = angles.items()
+        self._check_links()
+        values = self._angles
+        rounded = self._angle_ints
+        count = self._count
+        try:
+            for index, angle in angles:
+                if 0 <= index < count:
+                    rounded[index] = int(round(angle))  # Raises first if out of int16 range
+                    values[index] = angle
+        finally:
+            self._pose_version += 1
+
+    def set_lengths(self, lengths, start=0):
+        """
+        Set the lengths of links[start:] in one array store.
+
+        Args:
+            lengths: One length per link from start on, or a single
+                length for all of them
+            start: Index of the first link to set
+        """
+        self._check_links()
+        self._lengths[start:self._count] = lengths
+        self._pose_version += 1
+
+    def rounded_angles(self):
+        """
+        Whole-degree joint angles, J1 first, as sent in MOVE frames.
+
+        Returns:
+            list: One int per link
+        """
+        self._check_links()
+        return self._angle_ints[:self._count].tolist()
+
+    def clip_to_limits(self, angles):
+        """
+        Clamp joint angles to each link's [min_angle, max_angle].
+
+        Args:
+            angles: (..., J) joint angles in degrees, one column per link
+
+        Returns:
+            ndarray: Clipped copy of angles
+        """
+        self._check_links()
+        limits = self._limits[:self._count]
+        return np.clip(angles, limits[:, 0], limits[:, 1])
 
     def get_points(self):
-        return forward_kinematics(self.links)
+        self._check_links()
+        points = self._cached_points
+        if self._cached_version == self._pose_version:
+            return points
+
+        n = self._count
+        if fk_numba.NUMBA_AVAILABLE and n >= fk_numba.POSE_MIN_LINKS:
+            points = fk_numba.forward_kinematics_pose(self._angles[:n], self._axes[:n],
+                                                      self._lengths[:n])
+        else:
+            points = forward_kinematics(self.links, self._axes[:n], self._lengths[:n],
+                                        self._angles[:n])
+        points.flags.writeable = False  # Shared by every caller until the next change
+        self._cached_points = points
+        self._cached_tool = tuple(points[-1].tolist())
+        self._cached_version = self._pose_version
+        return points
+
+    def get_points_batch(self, angles_matrix):
+        """
+        Joint positions for many poses at once (e.g. a whole weld path).
+
+        Uses the numba kernel when numba is installed, the vectorized
+        NumPy version otherwise. The model's own pose is not touched.
+
+        Args:
+            angles_matrix: (N, J) joint angles in degrees, one column per link
+
+        Returns:
+            ndarray: (N, J+1, 3) joint positions per pose, base first
+        """
+        self._check_links()
+        n = self._count
+        angles = np.asarray(angles_matrix, dtype=np.float64)
+        if fk_numba.NUMBA_AVAILABLE:
+            return fk_numba.forward_kinematics_batch(angles, self._axes[:n], self._lengths[:n])
+        return forward_kinematics_batch(angles, self._axes[:n], self._lengths[:n])
 
     def get_tool_position(self):
+        """
+        Position of the end of the last link.
+
+        Kept with the cached FK points, so while the pose is unchanged
+        (e.g. capturing the point the view just drew) this is a lookup.
+
+        Returns:
+            tuple: (x, y, z) as floats; (0, 0, 0) without links
+        """
         if not self.links:
             return (0, 0, 0)
-        return self.get_points()[-1]
+        self.get_points()  # Refreshes _cached_tool if the pose changed
+        return self._cached_tool
 
@@ -18,13 +18,52 @@ WELDING MODES:
 
 import math
 import time
+import numpy as np
 try:
-    from ..robot.command_builder import generate_move_command
+    from ..robot.command_builder import (
+        generate_move_command, format_move_frame, format_joint_lines, format_move_tail,
+        rounded_angles, as_str)
 except ImportError:
     try:
-        from C2C.robot.command_builder import generate_move_command
+        from C2C.robot.command_builder import (
+            generate_move_command, format_move_frame, format_joint_lines, format_move_tail,
+            rounded_angles, as_str)
     except ImportError:
-        from robot.command_builder import generate_move_command
+        from robot.command_builder import (
+            generate_move_command, format_move_frame, format_joint_lines, format_move_tail,
+            rounded_angles, as_str)
+
+
+class JointPath:
+    """
+    Joint-space path as one (points, joints) array of angles.
+    
+    Indexing a single point gives the usual {'J1': angle, ...} dict, so it
+    drops in wherever a list of joint dicts was used; slicing gives
+    another JointPath. WeldingEngine reads the rows directly instead.
+    """
+    
+    def __init__(self, joint_names, angles):
+        """
+        Args:
+            joint_names: Joint names, one per column (e.g. ['J1', 'J2'])
+            angles: (points, joints) array of angles in degrees
+        """
+        self.joint_names = list(joint_names)
+        self.angles = angles
+    
+    def __len__(self):
+        return len(self.angles)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return JointPath(self.joint_names, self.angles[index])
+        return dict(zip(self.joint_names, self.angles[index].tolist()))
+    
+    def __iter__(self):
+        names = self.joint_names
+        for row in self.angles.tolist():
+            yield dict(zip(names, row))
 
 
 class WeldingEngine:
@@ -56,10 +95,21 @@ class WeldingEngine:
         self.continuous_speed = 30      # % of max speed
         self.continuous_path_delay = 100  # ms between path segments
         
+        # Fold repeated frames (same joints, same weld state) into one
+        # frame with their times summed
+        self.merge_repeated_frames = True
+        
         # State
         self.is_welding = False
         self.weld_points = []  # List of positions to weld
         self.current_weld_index = 0
+        
+        # Pose dict keys (in order) -> link index per key, see
+        # _cached_joint_indices()
+        self._joint_key_cache = {}
+        
+        # (pose version, frame) of the last emergency-stop frame
+        self._estop_frame = None
     
     def set_spot_parameters(self, weld_time_ms, spacing_cm, retract_offset_cm):
         """
@@ -103,53 +153,65 @@ class WeldingEngine:
             weld_points: List of (x, y, z) or joint angle dictionaries
         
         Returns:
-            list: List of command strings
+            list: List of encoded commands (bytes)
         """
         commands = []
+        links = self.robot.links
         
         print(f"🔥 Generating spot weld sequence for {len(weld_points)} points")
         
+        # Frame tails for this sequence (speed, time, weld), formatted once
+        tail_move = format_move_tail(50, 500, "OFF")
+        tail_weld_on = format_move_tail(0, self.spot_weld_time, "ON")  # No movement
+        tail_weld_off = format_move_tail(0, 50, "OFF")                 # Quick command
+        tail_retract = format_move_tail(30, 200, "OFF")
+        
+        # Joint lines and time of the last frame while it is a WELD:OFF
+        # frame that a following WELD:OFF frame at the same angles can fold
+        # into (e.g. weld-off + a retract that does not move)
+        merge = self.merge_repeated_frames
+        pending = None
+        
         for i, point in enumerate(weld_points):
             # Set robot to weld point position
             self._set_robot_to_position(point)
             
+            if not links:
+                # No joints - no frames (matches generate_move_command)
+                commands.extend([None] * (3 if i == len(weld_points) - 1 else 4))
+                print(f"  Point {i+1}/{len(weld_points)}: {len(commands)} commands generated")
+                continue
+            
+            # The three frames at the weld point share their joint lines;
+            # the retract only changes the last joint's line
+            model_angles = getattr(self.robot, 'rounded_angles', None)
+            angles = model_angles() if model_angles is not None else rounded_angles(links)
+            head = b"$MOVE\n" + format_joint_lines(angles[:-1])
+            prefix = head + format_joint_lines(angles[-1:], len(angles))
+            
             # 1. Move to weld point (WELD:OFF)
-            cmd = generate_move_command(
-                self.robot,
-                speed=50,
-                time_ms=500,
-                weld_state="OFF"
-            )
-            commands.append(cmd)
+            if merge and pending is not None and pending[0] == prefix:
+                commands[-1] = self._fused_off_frame(prefix, 50, pending[1] + 500)
+            else:
+                commands.append(prefix + tail_move)
             
             # 2. Start welding (WELD:ON) - stay at same position
-            cmd_weld_on = generate_move_command(
-                self.robot,
-                speed=0,  # No movement
-                time_ms=self.spot_weld_time,
-                weld_state="ON"
-            )
-            commands.append(cmd_weld_on)
-            
             # 3. Stop welding (WELD:OFF)
-            cmd_weld_off = generate_move_command(
-                self.robot,
-                speed=0,
-                time_ms=50,  # Quick command
-                weld_state="OFF"
-            )
-            commands.append(cmd_weld_off)
+            commands.append(prefix + tail_weld_on)
+            commands.append(prefix + tail_weld_off)
+            pending = (prefix, 50)
             
             # 4. Retract (if not last point)
             if i < len(weld_points) - 1:
                 self._retract_torch(self.spot_retract_offset)
-                cmd_retract = generate_move_command(
-                    self.robot,
-                    speed=30,
-                    time_ms=200,
-                    weld_state="OFF"
-                )
-                commands.append(cmd_retract)
+                retracted = head + format_joint_lines(rounded_angles(links[-1:]), len(angles))
+                if merge and retracted == prefix:
+                    # Weld-off and retract in one frame
+                    commands[-1] = self._fused_off_frame(retracted, 30, 250)
+                    pending = (retracted, 250)
+                else:
+                    commands.append(retracted + tail_retract)
+                    pending = (retracted, 200)
             
             print(f"  Point {i+1}/{len(weld_points)}: {len(commands)} commands generated")
         
@@ -166,84 +228,213 @@ class WeldingEngine:
         4. End welding (WELD:OFF)
         
         Args:
-            path_points: List of positions along weld path
+            path_points: List of positions along weld path (or a JointPath)
         
         Returns:
-            list: List of command strings
+            list: List of encoded commands (bytes)
         """
-        commands = []
-        
         if not path_points:
-            return commands
+            return []
+        
+        if not self.robot.links:
+            # No joints - no frames (matches generate_move_command)
+            return [None] * (len(path_points) + 2)
+        
+        stream, offsets = self.generate_continuous_weld_stream(path_points)
+        
+        # Copy the buffer out once, then cut per-command bytes (without the
+        # wire newline) out of it
+        data = stream.tobytes()
+        return [data[start:end - 1] for start, end in zip(offsets, offsets[1:])]
+    
+    def generate_continuous_weld_stream(self, path_points):
+        """
+        Generate the continuous welding sequence as one wire-format buffer.
+        
+        Same frames as generate_continuous_weld_sequence, each followed by
+        a newline and written straight into a single bytearray - no string
+        or dict per point. The whole buffer can go to the port in one
+        write, or be walked frame by frame through the offsets.
+        
+        Args:
+            path_points: JointPath, or list of positions along weld path
+        
+        Returns:
+            tuple: (memoryview of the buffer, offsets) - frame i is
+                view[offsets[i]:offsets[i + 1]], trailing newline included
+        """
+        buf = bytearray()
+        offsets = [0]
+        
+        links = self.robot.links
+        if not path_points or not links:
+            return memoryview(buf), offsets
         
         print(f"🔥 Generating continuous weld sequence for {len(path_points)} path points")
         
-        # 1. Move to start position (WELD:OFF)
-        self._set_robot_to_position(path_points[0])
-        cmd_start = generate_move_command(
-            self.robot,
-            speed=50,
-            time_ms=500,
-            weld_state="OFF"
-        )
-        commands.append(cmd_start)
+        # Whole path as integer angles for every link, computed once
+        poses = self._path_poses(path_points)
+        start = poses[0].tolist()
         
+        # 1. Move to start position (WELD:OFF)
         # 2. Start welding (WELD:ON)
-        cmd_weld_on = generate_move_command(
-            self.robot,
-            speed=0,
-            time_ms=100,
-            weld_state="ON"
-        )
-        commands.append(cmd_weld_on)
+        self._emit_move(buf, start, 50, 500, "OFF")
+        offsets.append(len(buf))
+        self._emit_move(buf, start, 0, 100, "ON")
+        offsets.append(len(buf))
         
         # 3. Follow path with welding ON
-        for i, point in enumerate(path_points[1:], start=1):
-            self._set_robot_to_position(point)
-            
-            # Calculate time based on distance and speed
-            # (simplified - use actual path length in production)
-            move_time = self.continuous_path_delay
-            
-            cmd = generate_move_command(
-                self.robot,
-                speed=self.continuous_speed,
-                time_ms=move_time,
-                weld_state="ON"  # Keep welding throughout path
-            )
-            commands.append(cmd)
+        # Calculate time based on distance and speed
+        # (simplified - use actual path length in production)
+        speed = self.continuous_speed
+        move_time = self.continuous_path_delay
+        total = len(poses)
+        rows, runs = self._pose_runs(poses[1:])
+        i = 1
+        for row, run in zip(rows, runs):
+            # A run of identical poses is one frame held for the whole run
+            self._emit_move(buf, row, speed, move_time * run, "ON")
+            offsets.append(len(buf))
             
-            if (i % 10) == 0:
-                print(f"  Progress: {i}/{len(path_points)} points")
+            last = i + run - 1
+            if last // 10 > (i - 1) // 10:
+                print(f"  Progress: {last}/{total} points")
+            i += run
         
         # 4. Stop welding (WELD:OFF)
-        cmd_weld_off = generate_move_command(
-            self.robot,
-            speed=0,
-            time_ms=50,
-            weld_state="OFF"
-        )
-        commands.append(cmd_weld_off)
-        
-        print(f"✅ Continuous weld sequence complete: {len(commands)} total commands")
-        return commands
+        self._emit_move(buf, poses[-1].tolist(), 0, 50, "OFF")
+        offsets.append(len(buf))
+        
+        print(f"✅ Continuous weld sequence complete: {len(offsets) - 1} total commands")
+        return memoryview(buf), offsets
+    
+    @staticmethod
+    def _fused_off_frame(joint_lines, speed, time_ms):
+        """
+        WELD:OFF frame standing in for two folded WELD:OFF frames.
+        
+        Args:
+            joint_lines: "$MOVE" line plus joint lines shared by both frames
+            speed: Speed of the later frame
+            time_ms: Both frames' times summed
+        
+        Returns:
+            bytes: Encoded command
+        """
+        return joint_lines + format_move_tail(speed, time_ms, "OFF")
+    
+    @staticmethod
+    def _emit_move(buf, angles_row, speed, time_ms, weld_state):
+        """
+        Append one MOVE frame (plus newline) to a wire buffer.
+        
+        Args:
+            buf: bytearray being filled
+            angles_row: Integer angles, one per link
+            speed: Movement speed (0-100)
+            time_ms: Movement time in milliseconds
+            weld_state: "ON" or "OFF"
+        """
+        buf += format_move_frame(angles_row, speed, time_ms, weld_state)
+        buf += b"\n"
+    
+    def _path_poses(self, path_points):
+        """
+        Full robot pose, as integer angles, at every path point.
+        
+        Joints the path does not name keep their current angle, and the
+        robot is left at the last point, as with per-point positioning.
+        
+        Args:
+            path_points: JointPath, or list of joint dicts / (x,y,z) tuples
+        
+        Returns:
+            ndarray: (points, links) int64 rounded angles
+        """
+        links = self.robot.links
+        count = len(links)
+        current = np.array([link.angle for link in links], dtype=np.float64)
+        
+        if isinstance(path_points, JointPath):
+            angles = path_points.angles
+            poses = np.broadcast_to(current, (len(angles), count)).copy()
+            for column, index in enumerate(self._joint_indices(path_points.joint_names)):
+                if index is not None and index < count:
+                    poses[:, index] = angles[:, column]
+        else:
+            # Irregular list - carry each joint forward until a point sets it
+            poses = np.empty((len(path_points), count))
+            for row, point in enumerate(path_points):
+                if isinstance(point, dict):
+                    indices = self._cached_joint_indices(point.keys())
+                    for index, angle in zip(indices, point.values()):
+                        if index is not None and index < count:
+                            current[index] = angle
+                poses[row] = current
+        
+        # Leave the robot at the end of the path
+        last = poses[-1].tolist()
+        set_angles = getattr(self.robot, 'set_angles', None)
+        if set_angles is not None:
+            set_angles(enumerate(last))
+        else:
+            for link, angle in zip(links, last):
+                link.angle = angle
+        
+        # Round half to even, as round() does for each frame
+        return np.rint(poses).astype(np.int64)
+    
+    def _pose_runs(self, poses):
+        """
+        Collapse consecutive identical poses into runs.
+        
+        Interpolated points often round to the same integer angles; each
+        run becomes a single frame instead of byte-identical repeats.
+        Every pose is its own run when merge_repeated_frames is off.
+        
+        Args:
+            poses: (points, links) integer angles
+        
+        Returns:
+            tuple: (rows, runs) - the pose starting each run, as lists,
+                and the number of points in each run
+        """
+        count = len(poses)
+        if count == 0 or not self.merge_repeated_frames:
+            return poses.tolist(), [1] * count
+        
+        changed = (poses[1:] != poses[:-1]).any(axis=1)
+        starts = np.flatnonzero(np.concatenate(([True], changed)))
+        runs = np.diff(np.append(starts, count))
+        return poses[starts].tolist(), runs.tolist()
     
     def generate_emergency_stop_sequence(self):
         """
         Generate emergency stop with welding OFF.
         
+        The WELD:OFF frame holds the robot's current pose, so it cannot be
+        a constant; it is built once per pose (RobotModel pose version)
+        and reused until the robot moves.
+        
         Returns:
             list: Emergency stop commands
         """
         commands = []
         
-        # Emergency stop with WELD:OFF
-        cmd = generate_move_command(
-            self.robot,
-            speed=0,
-            time_ms=0,
-            weld_state="OFF"
-        )
+        version = getattr(self.robot, 'pose_version', None)
+        cached = self._estop_frame
+        if version is not None and cached is not None and cached[0] == version:
+            cmd = cached[1]
+        else:
+            # Emergency stop with WELD:OFF
+            cmd = generate_move_command(
+                self.robot,
+                speed=0,
+                time_ms=0,
+                weld_state="OFF"
+            )
+            if version is not None:
+                self._estop_frame = (version, cmd)
         commands.append(cmd)
         
         return commands
@@ -256,18 +447,67 @@ class WeldingEngine:
             position: Dictionary of joint angles or (x,y,z) tuple
         """
         if isinstance(position, dict):
-            # Joint angles provided
-            for joint_name, angle in position.items():
-                # Find joint index (J1 -> 0, J2 -> 1, etc.)
-                if joint_name.startswith('J'):
-                    joint_idx = int(joint_name[1:]) - 1
-                    if joint_idx < len(self.robot.links):
-                        self.robot.links[joint_idx].angle = angle
+            # Joint angles provided - joint index per key (J1 -> 0, J2 -> 1,
+            # etc.), parsed once per key layout
+            indices = self._cached_joint_indices(position.keys())
+            self._set_robot_to_position_row(position.values(), indices)
         elif isinstance(position, (list, tuple)) and len(position) == 3:
             # Cartesian coordinates - would need IK
             # For now, use current angles (IK should be implemented separately)
             pass
     
+    @staticmethod
+    def _joint_indices(joint_names):
+        """
+        Link index for each joint name (J1 -> 0, ...), None if not a joint.
+        
+        Args:
+            joint_names: Sequence of joint names
+        
+        Returns:
+            list: Index (or None) per name
+        """
+        return [int(name[1:]) - 1 if name.startswith('J') else None
+                for name in joint_names]
+    
+    def _cached_joint_indices(self, joint_names):
+        """
+        _joint_indices() for a pose dict's keys, memoized per key layout.
+        
+        Weld paths repeat the same keys on every point, so the names are
+        only parsed the first time a layout is seen.
+        
+        Args:
+            joint_names: Keys of a pose dict, in dict order
+        
+        Returns:
+            tuple: Index (or None) per name
+        """
+        key = tuple(joint_names)
+        indices = self._joint_key_cache.get(key)
+        if indices is None:
+            indices = self._joint_key_cache[key] = tuple(self._joint_indices(key))
+        return indices
+    
+    def _set_robot_to_position_row(self, row, indices):
+        """
+        Set robot joints from one row of a JointPath.
+        
+        Args:
+            row: Angles, one per path column
+            indices: Link index per column, from _joint_indices()
+        """
+        pairs = [(index, angle) for index, angle in zip(indices, row) if index is not None]
+        
+        set_angles = getattr(self.robot, 'set_angles', None)
+        if set_angles is not None:
+            set_angles(pairs)
+        else:
+            links = self.robot.links
+            for index, angle in pairs:
+                if index < len(links):
+                    links[index].angle = angle
+    
     def _retract_torch(self, offset_cm):
         """
         Retract torch by specified offset.
@@ -295,24 +535,25 @@ class WeldingEngine:
             num_points: Number of interpolation points
         
         Returns:
-            list: List of interpolated positions
+            JointPath: num_points + 1 interpolated positions (indexes and
+                iterates like a list of joint-angle dicts)
+        
+        Raises:
+            ValueError: If num_points is less than 1
         """
-        points = []
+        if num_points < 1:
+            raise ValueError(f"num_points must be at least 1, got {num_points}")
         
-        # Linear interpolation between start and end
-        for i in range(num_points + 1):
-            t = i / num_points  # Parameter from 0 to 1
-            
-            point = {}
-            for joint_name in start_point.keys():
-                start_angle = start_point[joint_name]
-                end_angle = end_point[joint_name]
-                interpolated_angle = start_angle + t * (end_angle - start_angle)
-                point[joint_name] = interpolated_angle
-            
-            points.append(point)
+        joint_names = list(start_point.keys())
+        start_vec = np.array([start_point[name] for name in joint_names], dtype=np.float64)
+        end_vec = np.array([end_point[name] for name in joint_names], dtype=np.float64)
+        
+        # Linear interpolation between start and end, all points at once
+        # (t = i / num_points, parameter from 0 to 1)
+        t = (np.arange(num_points + 1) / num_points)[:, None]
+        angles = start_vec + t * (end_vec - start_vec)
         
-        return points
+        return JointPath(joint_names, angles)
     
     def calculate_weld_points_along_line(self, start, end, spacing_cm):
         """
@@ -324,7 +565,9 @@ class WeldingEngine:
             spacing_cm: Distance between weld points
         
         Returns:
-            list: List of weld point positions
+            JointPath: Weld point positions (indexes and iterates like a
+                list of joint-angle dicts); empty unless start and end
+                are both dicts
         """
         # Simplified - use interpolation
         # Calculate number of points based on spacing
@@ -335,7 +578,7 @@ class WeldingEngine:
         if isinstance(start, dict) and isinstance(end, dict):
             return self.interpolate_path_points(start, end, num_points)
         
-        return []
+        return JointPath([], np.zeros((0, 0)))
 
 
 # Testing
@@ -372,7 +615,7 @@ if __name__ == "__main__":
     spot_commands = engine.generate_spot_weld_sequence(weld_points)
     print(f"\nGenerated {len(spot_commands)} commands")
     print("\nFirst command:")
-    print(spot_commands[0])
+    print(as_str(spot_commands[0]))
     
     # Test continuous welding
     print("\n[TEST 2] Continuous Welding:")
@@ -387,6 +630,6 @@ if __name__ == "__main__":
     continuous_commands = engine.generate_continuous_weld_sequence(path_points)
     print(f"\nGenerated {len(continuous_commands)} commands")
     print("\nFirst command:")
-    print(continuous_commands[0])
+    print(as_str(continuous_commands[0]))
     
     print("\n✅ Welding engine test complete!")
@@ -1,15 +1,90 @@
 """Add Joint Dialog - Modal popup for adding new joints"""
 
+import math
+import weakref
+from collections import namedtuple
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, messagebox
 
 
+# (label, value) of each radio button
+MOTOR_SPECS = (("Servo Motor", "servo"), ("Stepper Motor", "stepper"))
+AXIS_SPECS = (("X-axis", "X"), ("Y-axis", "Y"), ("Z-axis", "Z"))
+
+# Colors of the dialog's widgets, set once per Tk root in the option
+# database instead of on every widget. They are scoped to the dialog's
+# main frame, so a messagebox opened over the dialog keeps its own look
+DIALOG_OPTIONS = (
+    ('*Background', '#2a2a2a'),
+    ('*Foreground', 'white'),
+    ('*Radiobutton.selectColor', '#3a3a3a'),
+    ('*Entry.background', '#3a3a3a'),
+    ('*Entry.insertBackground', 'white'),
+)
+
+DialogFonts = namedtuple('DialogFonts', 'normal section entry button small info')
+
+# Font objects per Tk root, created with the first dialog and shared by
+# every widget of every later one - a font tuple is resolved again for
+# each widget that uses it
+_FONTS = weakref.WeakKeyDictionary()
+
+
+def _dialog_fonts(widget):
+    """Get (creating once per Tk root) the dialog's shared Font objects."""
+    root = widget._root()
+    fonts = _FONTS.get(root)
+    if fonts is None:
+        def font(size, weight='normal'):
+            return tkfont.Font(root=root, family='Arial', size=size, weight=weight)
+        fonts = _FONTS[root] = DialogFonts(
+            normal=font(10),
+            section=font(11, 'bold'),
+            entry=font(12),
+            button=font(12, 'bold'),
+            small=font(8),
+            info=font(9),
+        )
+    return fonts
+
+
+_OPTIONS_ADDED = weakref.WeakSet()
+
+
+def _add_dialog_options(widget):
+    """Add DIALOG_OPTIONS to the option database of widget's Tk root, once."""
+    root = widget._root()
+    if root not in _OPTIONS_ADDED:
+        for pattern, value in DIALOG_OPTIONS:
+            # Leading '*': the first element of a pattern would otherwise
+            # have to match the application itself, not the Toplevel
+            root.option_add('*' + AddJointDialog.CLASS + '.main' + pattern, value)
+        _OPTIONS_ADDED.add(root)
+
+
+def _is_number_prefix(text):
+    """Whether text is a number, or could still become one as it is typed."""
+    if text in ('', '-', '.', '-.'):
+        return True
+    try:
+        return math.isfinite(float(text))
+    except ValueError:
+        return False
+
+
 class AddJointDialog:
+    CLASS = 'AddJointDialog'
+    WIDTH = 400
+    HEIGHT = 600
+    
     def __init__(self, parent):
         self.result = None
-        self.dialog = tk.Toplevel(parent)
+        self.parent = parent
+        # The class name (with main_frame's name) scopes DIALOG_OPTIONS
+        self.dialog = tk.Toplevel(parent, class_=self.CLASS)
         self.dialog.title("Add Joint")
-        self.dialog.geometry("400x600")
+        self.dialog.geometry(f"{self.WIDTH}x{self.HEIGHT}")
         self.dialog.configure(bg='#2a2a2a')
         self.dialog.resizable(False, False)
         
@@ -17,145 +92,113 @@ class AddJointDialog:
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
-        # Center on parent
-        self.dialog.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() - self.dialog.winfo_width()) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - self.dialog.winfo_height()) // 2
-        self.dialog.geometry(f"+{x}+{y}")
-        
         self._create_widgets()
         
+        # Center on parent once the event loop is idle - no forced layout pass
+        self.dialog.after_idle(self._center)
+    
+    def _center(self):
+        """Center the dialog on its parent"""
+        # The dialog's size is fixed, so only the parent needs measuring
+        parent = self.parent
+        x = parent.winfo_x() + (parent.winfo_width() - self.WIDTH) // 2
+        y = parent.winfo_y() + (parent.winfo_height() - self.HEIGHT) // 2
+        self.dialog.geometry(f"+{x}+{y}")
+        
     def _create_widgets(self):
         """Create all dialog widgets"""
-        main_frame = tk.Frame(self.dialog, bg='#2a2a2a', padx=20, pady=20)
+        _add_dialog_options(self.dialog)
+        fonts = _dialog_fonts(self.dialog)
+        
+        # Key-by-key check for the numeric entries; '%P' is the text the
+        # entry would hold if the edit were allowed
+        self._numeric = (self.dialog.register(_is_number_prefix), '%P')
+        
+        main_frame = tk.Frame(self.dialog, name='main', padx=20, pady=20)
         main_frame.pack(fill=tk.BOTH, expand=True)
         
+        # The sections are rows of one grid, each stretched to full width
+        main_frame.columnconfigure(0, weight=1)
+        
         # ===== SECTION 1: Joint Length =====
         length_frame = tk.LabelFrame(main_frame, text="Joint Length", 
-                                     bg='#2a2a2a', fg='white',
-                                     font=('Arial', 11, 'bold'), padx=10, pady=10)
-        length_frame.pack(fill=tk.X, pady=(0, 15))
+                                     font=fonts.section, padx=10, pady=10)
+        length_frame.grid(row=0, column=0, sticky=tk.EW, pady=(0, 15))
         
         length_label = tk.Label(length_frame, text="Joint Length (cm):", 
-                               bg='#2a2a2a', fg='white', font=('Arial', 10))
+                               font=fonts.normal)
         length_label.pack(anchor=tk.W, pady=(0, 5))
         
-        self.length_entry = tk.Entry(length_frame, font=('Arial', 12), 
-                                     bg='#3a3a3a', fg='white', 
-                                     insertbackground='white', width=15)
-        self.length_entry.insert(0, "10.0")
+        # Entries are bound to DoubleVars, so reads come back as numbers
+        self.length_var = tk.DoubleVar(value=10.0)
+        self.length_entry = tk.Entry(length_frame, font=fonts.entry, 
+                                     width=15,
+                                     textvariable=self.length_var,
+                                     validate='key',
+                                     validatecommand=self._numeric)
         self.length_entry.pack(fill=tk.X)
         
         # ===== SECTION 2: Motor Type =====
         motor_frame = tk.LabelFrame(main_frame, text="Motor Type", 
-                                   bg='#2a2a2a', fg='white',
-                                   font=('Arial', 11, 'bold'), padx=10, pady=10)
-        motor_frame.pack(fill=tk.X, pady=(0, 15))
+                                   font=fonts.section, padx=10, pady=10)
+        motor_frame.grid(row=1, column=0, sticky=tk.EW, pady=(0, 15))
         
         self.motor_type = tk.StringVar(value="servo")
         
-        servo_radio = tk.Radiobutton(motor_frame, text="Servo Motor", 
-                                    variable=self.motor_type, value="servo",
-                                    bg='#2a2a2a', fg='white', 
-                                    selectcolor='#3a3a3a',
-                                    font=('Arial', 10),
-                                    command=self._on_motor_type_change)
-        servo_radio.pack(anchor=tk.W, pady=2)
-        
-        stepper_radio = tk.Radiobutton(motor_frame, text="Stepper Motor", 
-                                      variable=self.motor_type, value="stepper",
-                                      bg='#2a2a2a', fg='white', 
-                                      selectcolor='#3a3a3a',
-                                      font=('Arial', 10),
-                                      command=self._on_motor_type_change)
-        stepper_radio.pack(anchor=tk.W, pady=2)
+        for text, value in MOTOR_SPECS:
+            tk.Radiobutton(motor_frame, text=text,
+                           variable=self.motor_type, value=value,
+                           command=self._on_motor_type_change,
+                           font=fonts.normal).pack(anchor=tk.W, pady=2)
         
         # ===== SECTION 3: Motor Parameters =====
         params_frame = tk.LabelFrame(main_frame, text="Motor Parameters", 
-                                    bg='#2a2a2a', fg='white',
-                                    font=('Arial', 11, 'bold'), padx=10, pady=10)
-        params_frame.pack(fill=tk.X, pady=(0, 15))
-        
-        # Servo parameters
-        self.servo_params_frame = tk.Frame(params_frame, bg='#2a2a2a')
-        self.servo_params_frame.pack(fill=tk.X)
-        
-        max_angle_label = tk.Label(self.servo_params_frame, 
-                                  text="Max Rotation Angle (°):", 
-                                  bg='#2a2a2a', fg='white', font=('Arial', 10))
-        max_angle_label.pack(anchor=tk.W, pady=(0, 5))
-        
-        self.max_angle_entry = tk.Entry(self.servo_params_frame, font=('Arial', 12), 
-                                       bg='#3a3a3a', fg='white', 
-                                       insertbackground='white', width=15)
-        self.max_angle_entry.insert(0, "180")
-        self.max_angle_entry.pack(fill=tk.X)
+                                    font=fonts.section, padx=10, pady=10)
+        params_frame.grid(row=2, column=0, sticky=tk.EW, pady=(0, 15))
+        params_frame.columnconfigure(0, weight=1)
         
-        servo_info = tk.Label(self.servo_params_frame, 
-                            text="(Slider range: 0 to max angle\nCenter = max/2, vertical position at center)", 
-                            bg='#2a2a2a', fg='#888888', font=('Arial', 8), 
-                            justify=tk.LEFT)
-        servo_info.pack(anchor=tk.W, pady=(5, 0))
-        
-        # Stepper parameters (info only)
-        self.stepper_params_frame = tk.Frame(params_frame, bg='#2a2a2a')
+        self._params_frame = params_frame
         
-        stepper_info = tk.Label(self.stepper_params_frame, 
-                               text="Rotation Range: 0° to 360°\nNo center offset - starts at 0°", 
-                               bg='#2a2a2a', fg='#888888', font=('Arial', 9), 
-                               justify=tk.LEFT)
-        stepper_info.pack(anchor=tk.W, pady=5)
+        # Servo and stepper parameters are stacked in one grid cell, which
+        # is as big as the larger of the two; each frame is built the first
+        # time its motor type is selected (see _on_motor_type_change), so
+        # the unused one costs nothing up front
+        self.servo_params_frame = None
+        self.stepper_params_frame = None
         
         # ===== SECTION 4: Rotation Axis =====
         axis_frame = tk.LabelFrame(main_frame, text="Rotation Axis", 
-                                  bg='#2a2a2a', fg='white',
-                                  font=('Arial', 11, 'bold'), padx=10, pady=10)
-        axis_frame.pack(fill=tk.X, pady=(0, 15))
+                                  font=fonts.section, padx=10, pady=10)
+        axis_frame.grid(row=3, column=0, sticky=tk.EW, pady=(0, 15))
         
         axis_label = tk.Label(axis_frame, text="Rotate in:", 
-                             bg='#2a2a2a', fg='white', font=('Arial', 10))
+                             font=fonts.normal)
         axis_label.pack(anchor=tk.W, pady=(0, 5))
         
         self.rotation_axis = tk.StringVar(value="Z")
         
-        axis_buttons_frame = tk.Frame(axis_frame, bg='#2a2a2a')
+        axis_buttons_frame = tk.Frame(axis_frame)
         axis_buttons_frame.pack(fill=tk.X)
         
-        x_radio = tk.Radiobutton(axis_buttons_frame, text="X-axis", 
-                                variable=self.rotation_axis, value="X",
-                                bg='#2a2a2a', fg='white', 
-                                selectcolor='#3a3a3a',
-                                font=('Arial', 10))
-        x_radio.pack(side=tk.LEFT, padx=5)
-        
-        y_radio = tk.Radiobutton(axis_buttons_frame, text="Y-axis", 
-                                variable=self.rotation_axis, value="Y",
-                                bg='#2a2a2a', fg='white', 
-                                selectcolor='#3a3a3a',
-                                font=('Arial', 10))
-        y_radio.pack(side=tk.LEFT, padx=5)
-        
-        z_radio = tk.Radiobutton(axis_buttons_frame, text="Z-axis", 
-                                variable=self.rotation_axis, value="Z",
-                                bg='#2a2a2a', fg='white', 
-                                selectcolor='#3a3a3a',
-                                font=('Arial', 10))
-        z_radio.pack(side=tk.LEFT, padx=5)
+        for text, value in AXIS_SPECS:
+            tk.Radiobutton(axis_buttons_frame, text=text,
+                           variable=self.rotation_axis, value=value,
+                           font=fonts.normal).pack(side=tk.LEFT, padx=5)
         
         # ===== SECTION 5: Buttons =====
-        button_frame = tk.Frame(main_frame, bg='#2a2a2a')
-        button_frame.pack(fill=tk.X, pady=(15, 0))
+        button_frame = tk.Frame(main_frame)
+        button_frame.grid(row=4, column=0, sticky=tk.EW, pady=(15, 0))
         
         add_btn = tk.Button(button_frame, text="Add Joint", 
-                           bg='#006400', fg='white',
-                           font=('Arial', 12, 'bold'), 
+                           bg='#006400',
+                           font=fonts.button, 
                            width=12, height=2,
                            command=self._on_add)
         add_btn.pack(side=tk.LEFT, padx=5, expand=True)
         
         cancel_btn = tk.Button(button_frame, text="Cancel", 
-                              bg='#8B0000', fg='white',
-                              font=('Arial', 12, 'bold'), 
+                              bg='#8B0000',
+                              font=fonts.button, 
                               width=12, height=2,
                               command=self._on_cancel)
         cancel_btn.pack(side=tk.LEFT, padx=5, expand=True)
@@ -163,20 +206,62 @@ class AddJointDialog:
         # Initialize motor type display
         self._on_motor_type_change()
         
+    def _build_servo_params(self):
+        """Create the servo parameter frame"""
+        fonts = _dialog_fonts(self.dialog)
+        self.servo_params_frame = tk.Frame(self._params_frame)
+        self.servo_params_frame.grid(row=0, column=0, sticky=tk.NSEW)
+        
+        max_angle_label = tk.Label(self.servo_params_frame, 
+                                  text="Max Rotation Angle (°):", 
+                                  font=fonts.normal)
+        max_angle_label.pack(anchor=tk.W, pady=(0, 5))
+        
+        self.max_angle_var = tk.DoubleVar(value=180)
+        self.max_angle_entry = tk.Entry(self.servo_params_frame, font=fonts.entry, 
+                                       width=15,
+                                       textvariable=self.max_angle_var,
+                                       validate='key',
+                                       validatecommand=self._numeric)
+        self.max_angle_entry.pack(fill=tk.X)
+        
+        servo_info = tk.Label(self.servo_params_frame, 
+                            text="(Slider range: 0 to max angle\nCenter = max/2, vertical position at center)", 
+                            fg='#888888', font=fonts.small, 
+                            justify=tk.LEFT)
+        servo_info.pack(anchor=tk.W, pady=(5, 0))
+    
+    def _build_stepper_params(self):
+        """Create the stepper parameter frame (info only)"""
+        fonts = _dialog_fonts(self.dialog)
+        self.stepper_params_frame = tk.Frame(self._params_frame)
+        self.stepper_params_frame.grid(row=0, column=0, sticky=tk.NSEW)
+        
+        stepper_info = tk.Label(self.stepper_params_frame, 
+                               text="Rotation Range: 0° to 360°\nNo center offset - starts at 0°", 
+                               fg='#888888', font=fonts.info, 
+                               justify=tk.LEFT)
+        stepper_info.pack(anchor=tk.W, pady=5)
+    
     def _on_motor_type_change(self):
         """Show/hide parameters based on motor type"""
+        # Both frames fill the same cell, so showing one is only a change of
+        # stacking order - no geometry pass runs
         if self.motor_type.get() == "servo":
-            self.stepper_params_frame.pack_forget()
-            self.servo_params_frame.pack(fill=tk.X)
+            if self.servo_params_frame is None:
+                self._build_servo_params()
+            self.servo_params_frame.tkraise()
         else:
-            self.servo_params_frame.pack_forget()
-            self.stepper_params_frame.pack(fill=tk.X)
+            if self.stepper_params_frame is None:
+                self._build_stepper_params()
+            self.stepper_params_frame.tkraise()
     
     def _on_add(self):
         """Validate and return joint parameters"""
         try:
+            # Each variable is read once, already parsed by its DoubleVar
             # Validate length
-            length = float(self.length_entry.get())
+            length = self.length_var.get()
             if length <= 0:
                 messagebox.showerror("Invalid Input", 
                                    "Joint length must be greater than 0 cm",
@@ -187,7 +272,7 @@ class AddJointDialog:
             
             # Set angle parameters based on motor type
             if motor_type == "servo":
-                max_angle = float(self.max_angle_entry.get())
+                max_angle = self.max_angle_var.get()
                 if max_angle <= 0:
                     messagebox.showerror("Invalid Input", 
                                        "Max angle must be greater than 0°",
@@ -211,7 +296,9 @@ class AddJointDialog:
             
             self.dialog.destroy()
             
-        except ValueError:
+        except (ValueError, tk.TclError):
+            # DoubleVar.get() raises TclError on text that is not a number;
+            # the key validation leaves only an unfinished one ('', '-', '.')
             messagebox.showerror("Invalid Input", 
                                "Please enter valid numeric values",
                                parent=self.dialog)
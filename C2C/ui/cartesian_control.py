@@ -27,13 +27,18 @@ class CartesianControlUI:
         tk.Label(self.frame, text="Y").grid(row=0, column=2)
         tk.Label(self.frame, text="Z").grid(row=0, column=4)
 
-        self.x = tk.Entry(self.frame, width=6)
-        self.y = tk.Entry(self.frame, width=6)
-        self.z = tk.Entry(self.frame, width=6)
+        # Entries are bound to DoubleVars, so reads come back as numbers
+        self.x_var = tk.DoubleVar(value=10)
+        self.y_var = tk.DoubleVar(value=10)
+        self.z_var = tk.DoubleVar(value=10)
 
-        self.x.insert(0, "10")
-        self.y.insert(0, "10")
-        self.z.insert(0, "10")
+        self.x = tk.Entry(self.frame, width=6, textvariable=self.x_var)
+        self.y = tk.Entry(self.frame, width=6, textvariable=self.y_var)
+        self.z = tk.Entry(self.frame, width=6, textvariable=self.z_var)
+
+        # (x, y, z, pose version) right after the last move - a repeat of
+        # the same target on an untouched robot has nothing left to do
+        self._last_move = None
 
         self.x.grid(row=0, column=1)
         self.y.grid(row=0, column=3)
@@ -42,24 +47,55 @@ class CartesianControlUI:
         tk.Button(self.frame, text="MOVE XYZ",
                   command=self.move).grid(row=0, column=6, padx=10)
 
-    def move(self):
+    def _target(self):
+        """Read the X/Y/Z entries, or None if any of them is not a number."""
         try:
-            x = float(self.x.get())
-            y = float(self.y.get())
-            z = float(self.z.get())
+            return self.x_var.get(), self.y_var.get(), self.z_var.get()
+        except tk.TclError:
+            # DoubleVar.get() raises TclError on text that is not a number
+            return None
+
+    def move(self):
+        target = self._target()
+        if target is None:
+            print("XYZ ERROR: X, Y and Z must be numbers")
+            return
+        x, y, z = target
+
+        robot = self.robot
+        version = getattr(robot, 'pose_version', None)
+        if version is not None and self._last_move == target + (version,):
+            return
 
+        try:
             a1, a2, z_val = inverse_kinematics_xyz(
-                x, y, z, self.robot.links
+                x, y, z, robot.links
             )
+        except ValueError as e:
+            # Too few joints, or a target out of reach
+            print("XYZ ERROR:", e)
+            return
 
-            self.robot.links[0].angle = a1
-            self.robot.links[1].angle = a2
+        # Links past the first two share the height; with none there is
+        # no length to write (and no FK cache to invalidate for it)
+        count = len(robot.links)
+        z_length = z_val / (count - 2) if count > 2 else None
+
+        # RobotModel takes both as array stores (one FK cache invalidation each)
+        if hasattr(robot, 'set_lengths'):
+            robot.set_angles({0: a1, 1: a2})
 
             # Adjust remaining links vertically
-            for i in range(2, len(self.robot.links)):
-                self.robot.links[i].length = z_val / max(1, len(self.robot.links)-2)
+            if z_length is not None:
+                robot.set_lengths(z_length, start=2)
+        else:
+            links = robot.links
+            links[0].angle = a1
+            links[1].angle = a2
+            for link in links[2:]:
+                link.length = z_length
 
-            self.update_callback()
+        if version is not None:
+            self._last_move = target + (robot.pose_version,)
 
-        except Exception as e:
-            print("XYZ ERROR:", e)
+        self.update_callback()
@@ -1,6 +1,17 @@
+import time
 import tkinter as tk
 
 class JointControlUI:
+    # Redraw at most this often while a slider is being dragged
+    FRAME_INTERVAL = 1 / 30
+
+    # Tcl proc returning the values of a list of Scales, so reading every
+    # slider is one call into Tcl instead of one per Scale
+    _GET_ALL = 'rotron_scale_values'
+    _GET_ALL_PROC = ('proc %s {paths} '
+                     '{set r {}; foreach p $paths {lappend r [$p get]}; return $r}'
+                     % _GET_ALL)
+
     def __init__(self, parent, robot, update_callback):
         self.robot = robot
         self.update_callback = update_callback
@@ -8,27 +19,95 @@ class JointControlUI:
         self.frame.pack(side=tk.LEFT, fill=tk.Y, padx=10)
 
         tk.Label(self.frame, text="Joint Control").pack()
+        self.frame.tk.eval(self._GET_ALL_PROC)
+
+        # after id of the pending _flush, None when nothing is pending
+        self._pending = None
+        # time.monotonic() of the last redraw
+        self._last_draw = 0.0
 
+        # Pool of Scales, reused across refreshes; the first _shown are
+        # packed, one per link, the rest are hidden until needed again
         self.sliders = []
-        for i, link in enumerate(robot.links):
-            s = tk.Scale(
-                self.frame,
-                from_=link.min_angle,
-                to=link.max_angle,
-                orient=tk.HORIZONTAL,
-                label=f"Joint {i+1}",
-                command=self.on_change
-            )
-            s.set(link.angle)
-            s.pack(fill=tk.X)
-            self.sliders.append(s)
+        self._shown = 0
+        # Tcl paths of the shown Scales, in joint order
+        self._paths = ()
+        # Their values as last applied to the robot (or set by refresh)
+        self._values = ()
+        self.refresh()
 
     def on_change(self, value):
-        for i, s in enumerate(self.sliders):
-            self.robot.links[i].angle = s.get()
+        # A drag fires this for every step; coalesce them so the model and
+        # the view are updated at most once per frame, with the latest values
+        if self._pending is None:
+            self._pending = self.frame.after_idle(self._flush)
+
+    def _flush(self):
+        self._pending = None
+
+        # Too soon after the last redraw: try again when the frame is due.
+        # The sliders are read then, so the steps in between are dropped
+        remaining = self.FRAME_INTERVAL - (time.monotonic() - self._last_draw)
+        if remaining > 0:
+            self._pending = self.frame.after(int(remaining * 1000) + 1, self._flush)
+            return
+
+        # Scale.set() in refresh also fires the command, once the Scale is
+        # drawn; sliders still where refresh put them have nothing to apply
+        values = self._read_values()
+        if values == self._values:
+            return
+
+        # Only the joints whose slider moved; the others keep their exact
+        # angles rather than the slider's rounded copy
+        angles = [(i, v) for i, (v, old) in enumerate(zip(values, self._values))
+                  if v != old]
+        self._values = values
+        set_angles = getattr(self.robot, 'set_angles', None)
+        if set_angles is not None:
+            set_angles(angles)
+        else:
+            links = self.robot.links
+            for i, angle in angles:
+                links[i].angle = angle
         self.update_callback()
+        self._last_draw = time.monotonic()
+
+    def _read_values(self):
+        """Values of the shown Scales, read with one Tcl call."""
+        interp = self.frame.tk
+        return tuple(map(float, interp.splitlist(interp.call(self._GET_ALL, self._paths))))
 
     def refresh(self):
-        for w in self.frame.winfo_children():
-            w.destroy()
-        self.__init__(self.frame.master, self.robot, self.update_callback)
+        if self._pending is not None:
+            self.frame.after_cancel(self._pending)
+            self._pending = None
+
+        # Reconfigure the Scales already there, create only the missing
+        # ones, and hide (not destroy) any left over
+        links = self.robot.links
+        count = len(links)
+        for i, link in enumerate(links):
+            options = dict(from_=link.min_angle, to=link.max_angle,
+                           label=f"Joint {i+1}")
+            if i < len(self.sliders):
+                s = self.sliders[i]
+                s.config(**options)
+            else:
+                # Options go in with the create command, not a later config
+                s = tk.Scale(self.frame, orient=tk.HORIZONTAL,
+                             command=self.on_change, **options)
+                self.sliders.append(s)
+            s.set(link.angle)
+
+        # A single pack (or pack forget) command for every Scale that
+        # appears or disappears, rather than one per Scale
+        shown = [s._w for s in self.sliders[self._shown:count]]
+        if shown:
+            self.frame.tk.call('pack', *shown, '-fill', tk.X)
+        hidden = [s._w for s in self.sliders[count:self._shown]]
+        if hidden:
+            self.frame.tk.call('pack', 'forget', *hidden)
+        self._shown = count
+        self._paths = tuple(s._w for s in self.sliders[:count])
+        self._values = self._read_values()
@@ -9,6 +9,9 @@ project_root = Path(__file__).resolve().parent.parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
+import queue
+import threading
+import numpy as np
 import tkinter as tk
 from tkinter import ttk, messagebox
 try:
@@ -19,6 +22,7 @@ try:
     from ..robot.command_builder import generate_move_command, generate_stop_command, format_command_for_display
     from ..hardware.esp32_comm import send_command_to_esp32, get_esp32_communicator
     from ..robot.ik import inverse_kinematics_xyz
+    from ..robot import fk_numba
 except ImportError:
     try:
         from C2C.ui.robot_view_3d import RobotView3D
@@ -28,6 +32,7 @@ except ImportError:
         from C2C.robot.command_builder import generate_move_command, generate_stop_command, format_command_for_display
         from C2C.hardware.esp32_comm import send_command_to_esp32, get_esp32_communicator
         from C2C.robot.ik import inverse_kinematics_xyz
+        from C2C.robot import fk_numba
     except ImportError:
         from ui.robot_view_3d import RobotView3D
         from ui.robot_view_2d import RobotView2D
@@ -36,6 +41,7 @@ except ImportError:
         from robot.command_builder import generate_move_command, generate_stop_command, format_command_for_display
         from hardware.esp32_comm import send_command_to_esp32, get_esp32_communicator
         from robot.ik import inverse_kinematics_xyz
+        from robot import fk_numba
 
 
 class MainWindow:
@@ -47,6 +53,18 @@ class MainWindow:
     - Fixed Bottom: Emergency stop + status
     """
     
+    SLIDER_DEBOUNCE_MS = 40
+    # Angle changes smaller than this (degrees) are treated as no change
+    ANGLE_EPSILON = 1e-3
+    
+    # Tcl proc that empties a Treeview and inserts one row per item of a
+    # list, so refilling the weld point table is one call from Python
+    _FILL_TABLE = 'rotron_fill_table'
+    _FILL_TABLE_PROC = ('proc %s {tree rows} '
+                        '{$tree delete [$tree children {}]; '
+                        'foreach row $rows {$tree insert {} end -values $row}}'
+                        % _FILL_TABLE)
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("ROTRON 2.0 - Industrial HMI")
@@ -57,10 +75,36 @@ class MainWindow:
         self.current_section = None  # Track active section
         
         # Welding data
-        self.weld_points = []  # List of (x, y, z) tuples
+        # Weld points as rows of one float array (see weld_points); only
+        # the first _weld_count rows are used, capacity doubles as needed
+        self._weld_buf = np.zeros((0, 3))
+        self._weld_count = 0
         self.weld_mode = tk.StringVar(value="spot")  # spot or continuous
         self.spot_submode = tk.StringVar(value="line")  # line or only
         
+        # Slider/entry edits update the model at once; the MOVE command and
+        # the redraw follow once input has been quiet for SLIDER_DEBOUNCE_MS
+        self._pending_after_id = None
+        self._pending_index = None
+        # Joint index of the slider held down with the mouse, or None
+        self._dragging = None
+        # (pose version, view mode) of the last update_view paint
+        self._rendered = None
+        
+        # Jog MOVEs are handed to a worker thread, newest only, so the Tk
+        # thread never waits on the ESP32 link. STOPs bump _cmd_epoch
+        # under _send_lock, so a MOVE queued before a STOP is never sent
+        # after it
+        self._cmd_queue = queue.Queue(maxsize=1)
+        self._send_lock = threading.Lock()
+        self._cmd_epoch = 0
+        threading.Thread(target=self._cmd_worker, daemon=True).start()
+        
+        # Compile the numba FK kernels (if numba is installed) in the
+        # background, so the first long-arm redraw does not wait for it
+        if fk_numba.NUMBA_AVAILABLE:
+            threading.Thread(target=fk_numba.warm_up, daemon=True).start()
+        
         self._build_ui()
         
     def _build_ui(self):
@@ -94,7 +138,10 @@ class MainWindow:
         self.canvas_window = self.slider_canvas.create_window((0, 0), window=self.slider_frame, anchor='nw')
         self.slider_frame.bind('<Configure>', lambda e: self.slider_canvas.configure(scrollregion=self.slider_canvas.bbox('all')))
         
-        self.sliders = []
+        self.sliders = []        # Columns of the current joints
+        self._slider_pool = []   # All columns ever built, reused
+        self._add_joint_panel = None
+        self._delete_armed = None  # (joint index, revert after id) or None
         
         # +joint button
         controls_frame = tk.Frame(left_panel, bg='#2a2a2a')
@@ -171,6 +218,11 @@ class MainWindow:
         self.work_canvas_window = self.work_canvas.create_window((0, 0), window=self.work_frame, anchor='nw')
         self.work_frame.bind('<Configure>', lambda e: self.work_canvas.configure(scrollregion=self.work_canvas.bbox('all')))
         
+        # Mode panels (teach/welding/painting) by name, each built the first
+        # time its mode is opened; switching modes only hides and shows them
+        self._panels = {}
+        self._active_panel = None
+        
         # ================== FIXED BOTTOM BAR ==================
         bottom_bar = tk.Frame(self.root, bg='#2a2a2a', height=80)
         bottom_bar.pack(side=tk.BOTTOM, fill=tk.X)
@@ -200,99 +252,231 @@ class MainWindow:
     
     def add_joint(self):
         """Add new joint via inline dialog"""
-        # Simple inline dialog instead of popup
+        # Simple inline dialog instead of popup; the panel is built once
+        # and only reset and shown here
+        if self._add_joint_panel is None:
+            self._build_add_joint_panel()
+        self._add_length_var.set("10")
+        self._add_motor_var.set("servo")
+        self._add_axis_var.set("Z")
+        self._add_joint_panel.pack(side=tk.LEFT, padx=10, pady=10)
+    
+    def _build_add_joint_panel(self):
+        """Create the (hidden) inline Add Joint panel"""
         dialog_frame = tk.Frame(self.slider_frame, bg='#3a3a3a', relief=tk.RAISED, bd=3)
-        dialog_frame.pack(side=tk.LEFT, padx=10, pady=10)
+        self._add_joint_panel = dialog_frame
         
         tk.Label(dialog_frame, text="Add Joint", fg='white', bg='#3a3a3a', font=('Arial', 10, 'bold')).grid(row=0, column=0, columnspan=2, pady=5)
         
         tk.Label(dialog_frame, text="Length (cm):", fg='white', bg='#3a3a3a').grid(row=1, column=0, sticky='e', padx=5)
-        length_entry = tk.Entry(dialog_frame, width=10)
-        length_entry.insert(0, "10")
-        length_entry.grid(row=1, column=1, padx=5, pady=2)
+        self._add_length_var = tk.StringVar(self.root)
+        self._add_length_entry = tk.Entry(dialog_frame, width=10, textvariable=self._add_length_var)
+        self._add_length_entry.grid(row=1, column=1, padx=5, pady=2)
         
         tk.Label(dialog_frame, text="Motor:", fg='white', bg='#3a3a3a').grid(row=2, column=0, sticky='e', padx=5)
-        motor_var = tk.StringVar(value="servo")
-        tk.OptionMenu(dialog_frame, motor_var, "servo", "stepper").grid(row=2, column=1, padx=5, pady=2)
+        self._add_motor_var = tk.StringVar(value="servo")
+        tk.OptionMenu(dialog_frame, self._add_motor_var, "servo", "stepper").grid(row=2, column=1, padx=5, pady=2)
         
         tk.Label(dialog_frame, text="Axis:", fg='white', bg='#3a3a3a').grid(row=3, column=0, sticky='e', padx=5)
-        axis_var = tk.StringVar(value="Z")
-        tk.OptionMenu(dialog_frame, axis_var, "X", "Y", "Z").grid(row=3, column=1, padx=5, pady=2)
-        
-        def confirm():
-            try:
-                length = float(length_entry.get())
-                link = Link(length=length, motor_type=motor_var.get(), rotation_axis=axis_var.get())
-                self.robot.add_link(link)
-                dialog_frame.destroy()
-                self.rebuild_sliders()
-                self.update_view()
-                self.status_label.config(text=f"✓ Joint J{len(self.robot.links)} added")
-            except ValueError:
-                messagebox.showerror("Error", "Invalid length value")
+        self._add_axis_var = tk.StringVar(value="Z")
+        tk.OptionMenu(dialog_frame, self._add_axis_var, "X", "Y", "Z").grid(row=3, column=1, padx=5, pady=2)
         
         btn_frame = tk.Frame(dialog_frame, bg='#3a3a3a')
         btn_frame.grid(row=4, column=0, columnspan=2, pady=5)
-        tk.Button(btn_frame, text="OK", command=confirm, bg='#00aa00', fg='white', width=6).pack(side=tk.LEFT, padx=2)
-        tk.Button(btn_frame, text="Cancel", command=dialog_frame.destroy, bg='#aa0000', fg='white', width=6).pack(side=tk.LEFT, padx=2)
+        tk.Button(btn_frame, text="OK", command=self._confirm_add_joint, bg='#00aa00', fg='white', width=6).pack(side=tk.LEFT, padx=2)
+        tk.Button(btn_frame, text="Cancel", command=dialog_frame.pack_forget, bg='#aa0000', fg='white', width=6).pack(side=tk.LEFT, padx=2)
+    
+    def _confirm_add_joint(self):
+        """OK in the Add Joint panel"""
+        try:
+            length = float(self._add_length_entry.get())
+            link = Link(length=length, motor_type=self._add_motor_var.get(),
+                        rotation_axis=self._add_axis_var.get())
+            self.robot.add_link(link)
+            self._add_joint_panel.pack_forget()
+            self.rebuild_sliders()
+            self.update_view()
+            self.status_label.config(text=f"✓ Joint J{len(self.robot.links)} added")
+        except ValueError:
+            messagebox.showerror("Error", "Invalid length value")
     
     def rebuild_sliders(self):
         """Rebuild all joint sliders"""
-        for widget in self.slider_frame.winfo_children():
-            widget.destroy()
-        self.sliders.clear()
-        
-        for i, link in enumerate(self.robot.links):
-            slider_col = tk.Frame(self.slider_frame, bg='#1a1a1a', relief=tk.FLAT, bd=1)
-            slider_col.pack(side=tk.LEFT, padx=3, pady=5)
-            
-            header = tk.Frame(slider_col, bg='#1a1a1a')
-            header.pack()
-            
-            joint_label = tk.Label(header, text=f"J{i+1}", bg='#1a1a1a', fg='white', font=('Arial', 9, 'bold'))
-            joint_label.pack(side=tk.LEFT, padx=2)
-            
-            delete_btn = tk.Button(header, text="X", bg='#8B0000', fg='white',
-                                  font=('Arial', 8, 'bold'), width=2, height=1,
-                                  command=lambda idx=i: self.delete_joint(idx))
-            delete_btn.pack(side=tk.LEFT, padx=2)
-            
-            slider = tk.Scale(slider_col, from_=link.max_angle, to=link.min_angle,
-                            orient=tk.VERTICAL, bg='#2a2a2a', fg='#00ff00',
-                            troughcolor='#0a0a0a', activebackground='#3a3a3a',
-                            length=250, width=25, sliderlength=30, showvalue=0,
-                            command=lambda v, idx=i: self.on_slider_change(idx, v))
-            slider.set(link.angle)
-            slider.pack()
-            
-            value_entry = tk.Entry(slider_col, width=6, font=('Arial', 9), justify='center')
-            value_entry.insert(0, f"{link.angle:.1f}")
-            value_entry.pack(pady=2)
-            value_entry.bind('<Return>', lambda e, idx=i, s=slider, ent=value_entry: self.on_entry_change(idx, s, ent))
-            
-            self.sliders.append({'slider': slider, 'entry': value_entry})
+        # Columns are pooled: the ones already there are reconfigured, only
+        # missing ones are created, and surplus ones are hidden, not destroyed
+        if self._add_joint_panel is not None:
+            self._add_joint_panel.pack_forget()
+        
+        links = self.robot.links
+        pool = self._slider_pool
+        shown = len(self.sliders)
+        for i, link in enumerate(links):
+            if i < len(pool):
+                col = pool[i]
+                col['slider'].configure(from_=link.max_angle, to=link.min_angle)
+            else:
+                col = self._make_slider_col(i, link)
+                pool.append(col)
+            col['slider'].set(link.angle)
+            col['var'].set(f"{link.angle:.1f}")
+            if i >= shown:
+                col['frame'].pack(side=tk.LEFT, padx=3, pady=5)
+        
+        for col in pool[len(links):shown]:
+            col['frame'].pack_forget()
+        self.sliders = pool[:len(links)]
+    
+    def _make_slider_col(self, i, link):
+        """Create the slider column for joint i (not packed)"""
+        slider_col = tk.Frame(self.slider_frame, bg='#1a1a1a', relief=tk.FLAT, bd=1)
+        
+        header = tk.Frame(slider_col, bg='#1a1a1a')
+        header.pack()
+        
+        joint_label = tk.Label(header, text=f"J{i+1}", bg='#1a1a1a', fg='white', font=('Arial', 9, 'bold'))
+        joint_label.pack(side=tk.LEFT, padx=2)
+        
+        delete_btn = tk.Button(header, text="X", bg='#8B0000', fg='white',
+                              font=('Arial', 8, 'bold'), width=2, height=1,
+                              command=lambda idx=i: self.delete_joint(idx))
+        delete_btn.pack(side=tk.LEFT, padx=2)
+        
+        slider = tk.Scale(slider_col, from_=link.max_angle, to=link.min_angle,
+                        orient=tk.VERTICAL, bg='#2a2a2a', fg='#00ff00',
+                        troughcolor='#0a0a0a', activebackground='#3a3a3a',
+                        length=250, width=25, sliderlength=30, showvalue=0,
+                        command=lambda v, idx=i: self.on_slider_change(idx, v))
+        slider.bind('<ButtonPress-1>', lambda e, idx=i: self._on_slider_press(idx))
+        slider.bind('<ButtonRelease-1>', lambda e, idx=i: self._on_slider_commit(idx))
+        slider.pack()
+        
+        # The entry shows a StringVar: one set() replaces a delete + insert
+        value_var = tk.StringVar(self.root)
+        value_entry = tk.Entry(slider_col, width=6, font=('Arial', 9), justify='center',
+                               textvariable=value_var)
+        value_entry.pack(pady=2)
+        value_entry.bind('<Return>', lambda e, idx=i, s=slider, ent=value_entry: self.on_entry_change(idx, s, ent))
+        
+        return {'frame': slider_col, 'delete': delete_btn, 'slider': slider,
+                'entry': value_entry, 'var': value_var}
     
     def delete_joint(self, index):
-        """Delete a joint"""
-        if messagebox.askyesno("Confirm", f"Delete Joint J{index+1}?"):
-            self.robot.links.pop(index)
-            self.rebuild_sliders()
-            self.update_view()
-            self.status_label.config(text=f"✓ Joint deleted")
+        """Delete a joint (first click arms the button, second confirms)"""
+        # Inline confirm instead of a modal askyesno, whose nested event
+        # loop would hold up everything else while it is open
+        if self._delete_armed is not None:
+            self._disarm_delete()
+        self._slider_pool[index]['delete'].configure(
+            text="OK?", bg='#ff0000', command=lambda: self._confirm_delete(index))
+        self._delete_armed = (index, self.root.after(2000, self._disarm_delete))
+        self.status_label.config(text=f"Click OK? to delete Joint J{index+1}")
+    
+    def _disarm_delete(self):
+        """Turn an armed delete button back into X"""
+        index, after_id = self._delete_armed
+        self._delete_armed = None
+        self.root.after_cancel(after_id)
+        self._slider_pool[index]['delete'].configure(
+            text="X", bg='#8B0000', command=lambda: self.delete_joint(index))
+    
+    def _confirm_delete(self, index):
+        """Second click on an armed delete button"""
+        self._disarm_delete()
+        self.robot.remove_link(index)
+        self.rebuild_sliders()
+        self.update_view()
+        self.status_label.config(text=f"✓ Joint deleted")
     
     def on_slider_change(self, index, value):
         """Handle slider movement"""
         if index < len(self.robot.links):
-            self.robot.links[index].angle = float(value)
+            value = float(value)
+            link = self.robot.links[index]
+            # The Scale also reports set() calls (rebuild_sliders,
+            # on_entry_change); an unchanged angle needs no redraw or MOVE
+            if abs(value - link.angle) < self.ANGLE_EPSILON:
+                return
+            link.angle = value
             if index < len(self.sliders):
-                self.sliders[index]['entry'].delete(0, tk.END)
-                self.sliders[index]['entry'].insert(0, f"{float(value):.1f}")
+                self.sliders[index]['var'].set(f"{value:.1f}")
             
-            command = generate_move_command(self.robot, speed=30, time_ms=100)
-            if command:
-                send_command_to_esp32(command)
-            
-            self.update_view()
+            # A mouse drag is sent and fully redrawn once, on release, and
+            # only previewed meanwhile; keyboard and programmatic moves go
+            # through the debounce
+            if self._dragging is None:
+                self._schedule_slider_flush(index)
+            else:
+                self._preview_view()
+    
+    def _on_slider_press(self, index):
+        """Mouse down on a slider - hold its MOVE until release"""
+        self._dragging = index
+    
+    def _on_slider_commit(self, index):
+        """Mouse released on a slider - send the final pose now"""
+        if self._dragging != index:
+            # Drag was cut short (e.g. by an emergency stop)
+            return
+        self._dragging = None
+        self._cancel_slider_flush()
+        self._flush_slider()
+    
+    def _schedule_slider_flush(self, index):
+        """(Re)start the quiet-period timer for sending the current pose"""
+        if self._pending_after_id is not None:
+            self.root.after_cancel(self._pending_after_id)
+        self._pending_index = index
+        self._pending_after_id = self.root.after(self.SLIDER_DEBOUNCE_MS,
+                                                 self._flush_slider)
+    
+    def _cancel_slider_flush(self):
+        """Drop a pending slider flush, if any"""
+        if self._pending_after_id is not None:
+            self.root.after_cancel(self._pending_after_id)
+            self._pending_after_id = None
+            self._pending_index = None
+    
+    def _flush_slider(self):
+        """Send one MOVE for the latest pose and redraw once"""
+        self._pending_after_id = None
+        self._pending_index = None
+        
+        command = generate_move_command(self.robot, speed=30, time_ms=100)
+        if command:
+            self._queue_command(command)
+        
+        self.update_view()
+    
+    def _queue_command(self, command):
+        """Hand a MOVE to the send worker, replacing one not yet sent"""
+        item = (self._cmd_epoch, command)
+        try:
+            self._cmd_queue.put_nowait(item)
+        except queue.Full:
+            # Stale jog position - only the newest matters
+            try:
+                self._cmd_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._cmd_queue.put_nowait(item)
+    
+    def _cmd_worker(self):
+        """Send queued MOVEs to the ESP32 (runs on its own thread)"""
+        while True:
+            epoch, command = self._cmd_queue.get()
+            with self._send_lock:
+                if epoch == self._cmd_epoch:
+                    send_command_to_esp32(command)
+    
+    def _send_stop(self, stop_command):
+        """Send STOP at priority, dropping any MOVE still waiting to go out"""
+        with self._send_lock:
+            self._cmd_epoch += 1
+            try:
+                self._cmd_queue.get_nowait()
+            except queue.Empty:
+                pass
+            send_command_to_esp32(stop_command, priority=True)
     
     def on_entry_change(self, index, slider, entry):
         """Handle manual entry"""
@@ -301,57 +485,67 @@ class MainWindow:
             if index < len(self.robot.links):
                 link = self.robot.links[index]
                 value = max(link.min_angle, min(link.max_angle, value))
-                self.robot.links[index].angle = value
+                self.sliders[index]['var'].set(f"{value:.1f}")
+                if abs(value - link.angle) < self.ANGLE_EPSILON:
+                    return  # Confirmed as is - nothing to move
+                link.angle = value
                 slider.set(value)
-                entry.delete(0, tk.END)
-                entry.insert(0, f"{value:.1f}")
                 
-                command = generate_move_command(self.robot, speed=30, time_ms=100)
-                if command:
-                    send_command_to_esp32(command)
-                
-                self.update_view()
+                self._schedule_slider_flush(index)
         except ValueError:
             if index < len(self.robot.links):
-                entry.delete(0, tk.END)
-                entry.insert(0, f"{self.robot.links[index].angle:.1f}")
+                self.sliders[index]['var'].set(f"{self.robot.links[index].angle:.1f}")
     
     # ==================== WORK AREA MANAGEMENT ====================
     
     def clear_work_area(self):
         """Clear the scrollable work area"""
-        for widget in self.work_frame.winfo_children():
-            widget.destroy()
+        # Panels are only hidden - each is built once and shown again as is
+        if self._active_panel is not None:
+            self._active_panel.pack_forget()
+            self._active_panel = None
         self.current_section = None
         self.status_label.config(text="Work area cleared")
     
+    def _show_panel(self, name, build):
+        """Show work-area panel name, calling build(panel) to fill it the first time"""
+        panel = self._panels.get(name)
+        if panel is None:
+            panel = self._panels[name] = tk.Frame(self.work_frame, bg='#1a1a1a')
+            build(panel)
+        self.clear_work_area()
+        panel.pack(fill=tk.BOTH, expand=True)
+        self._active_panel = panel
+        self.current_section = name
+    
     def load_teach_section(self):
         """Load teach mode interface into work area"""
         if not self.robot.links:
             messagebox.showwarning("No Joints", "Please add at least one joint before teaching.")
             return
         
-        self.clear_work_area()
-        self.current_section = "teach"
+        self._show_panel("teach", self._build_teach_panel)
         self.status_label.config(text="TEACH MODE ACTIVE")
-        
-        # Teach interface content
-        tk.Label(self.work_frame, text="TEACH MODE", fg='white', bg='#1a1a1a',
+    
+    def _build_teach_panel(self, panel):
+        """Create the teach mode widgets"""
+        tk.Label(panel, text="TEACH MODE", fg='white', bg='#1a1a1a',
                 font=('Arial', 16, 'bold')).pack(pady=10)
         
-        tk.Label(self.work_frame, text="[Teach mode interface - to be implemented]",
+        tk.Label(panel, text="[Teach mode interface - to be implemented]",
                 fg='#aaaaaa', bg='#1a1a1a', font=('Arial', 12)).pack(pady=20)
     
     def load_painting_section(self):
         """Load painting mode interface"""
-        self.clear_work_area()
-        self.current_section = "painting"
+        self._show_panel("painting", self._build_painting_panel)
         self.status_label.config(text="PAINTING MODE ACTIVE")
-        
-        tk.Label(self.work_frame, text="PAINTING MODE", fg='white', bg='#1a1a1a',
+    
+    def _build_painting_panel(self, panel):
+        """Create the painting mode widgets"""
+        tk.Label(panel, text="PAINTING MODE", fg='white', bg='#1a1a1a',
                 font=('Arial', 16, 'bold')).pack(pady=10)
         
-        tk.Label(self.work_frame, text="[Painting mode interface - to be implemented]",
+        tk.Label(panel, text="[Painting mode interface - to be implemented]",
                 fg='#aaaaaa', bg='#1a1a1a', font=('Arial', 12)).pack(pady=20)
     
     def load_welding_section(self):
@@ -360,13 +554,18 @@ class MainWindow:
             messagebox.showwarning("No Joints", "Please add at least one joint before welding.")
             return
         
-        self.clear_work_area()
-        self.current_section = "welding"
+        self._show_panel("welding", self._build_welding_panel)
         self.status_label.config(text="WELDING MODE ACTIVE")
-        self.weld_points.clear()
         
+        # Each visit starts a new job; the parameter entries keep their values
+        self._clear_weld_points()
+        self.update_coord_table()
+        self.update_weld_visualization()
+    
+    def _build_welding_panel(self, panel):
+        """Create the welding control panel widgets"""
         # Main welding container
-        container = tk.Frame(self.work_frame, bg='#2a2a2a', relief=tk.RAISED, bd=2)
+        container = tk.Frame(panel, bg='#2a2a2a', relief=tk.RAISED, bd=2)
         container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # HEADER
@@ -475,6 +674,7 @@ class MainWindow:
         self.coord_table.column('Z', width=80, anchor='center')
         
         self.coord_table.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.coord_table.tk.eval(self._FILL_TABLE_PROC)
         
         # Table controls
         table_btn_frame = tk.Frame(table_frame, bg='#2a2a2a')
@@ -571,6 +771,31 @@ class MainWindow:
             self.spot_frame.pack_forget()
             self.spots_frame.grid_remove()
     
+    @property
+    def weld_points(self):
+        """(N, 3) array view of the weld points, one (x, y, z) row each"""
+        return self._weld_buf[:self._weld_count]
+    
+    def _add_weld_point(self, x, y, z):
+        """Append a weld point, growing the buffer if it is full"""
+        n = self._weld_count
+        if n == len(self._weld_buf):
+            buf = np.zeros((max(8, 2 * n), 3))
+            buf[:n] = self._weld_buf[:n]
+            self._weld_buf = buf
+        self._weld_buf[n] = (x, y, z)
+        self._weld_count = n + 1
+    
+    def _remove_weld_point(self, index):
+        """Remove the weld point at index; later points move up one row"""
+        n = self._weld_count
+        self._weld_buf[index:n - 1] = self._weld_buf[index + 1:n]
+        self._weld_count = n - 1
+    
+    def _clear_weld_points(self):
+        """Remove all weld points (the buffer is kept for reuse)"""
+        self._weld_count = 0
+    
     def add_coordinate_from_entry(self):
         """Add point from manual entry"""
         try:
@@ -578,14 +803,17 @@ class MainWindow:
             y = float(self.y_entry.get())
             z = float(self.z_entry.get())
             
-            self.weld_points.append((x, y, z))
-            self.update_coord_table()
+            self._add_weld_point(x, y, z)
+            self._append_coord_row(x, y, z)
             
             # Clear entries
             self.x_entry.delete(0, tk.END)
             self.y_entry.delete(0, tk.END)
             self.z_entry.delete(0, tk.END)
             
+            # No update()/update_idletasks() here: the table row, entries,
+            # status and weld length all repaint in the one idle pass Tk
+            # runs after this handler returns
             self.status_label.config(text=f"✓ Point added: ({x:.2f}, {y:.2f}, {z:.2f})")
             self.update_weld_visualization()
         except ValueError:
@@ -594,20 +822,21 @@ class MainWindow:
     def capture_current_position(self):
         """Capture current robot tool position"""
         x, y, z = self.robot.get_tool_position()
-        self.weld_points.append((x, y, z))
-        self.update_coord_table()
+        self._add_weld_point(x, y, z)
+        self._append_coord_row(x, y, z)
         self.status_label.config(text=f"✓ Position captured: ({x:.2f}, {y:.2f}, {z:.2f})")
         self.update_weld_visualization()
     
     def update_coord_table(self):
         """Update the coordinate table display"""
-        # Clear table
-        for item in self.coord_table.get_children():
-            self.coord_table.delete(item)
-        
-        # Repopulate
-        for i, (x, y, z) in enumerate(self.weld_points):
-            self.coord_table.insert('', 'end', values=(i+1, f"{x:.2f}", f"{y:.2f}", f"{z:.2f}"))
+        # Clear and repopulate in one Tcl call (see _FILL_TABLE_PROC)
+        rows = [(i+1, f"{x:.2f}", f"{y:.2f}", f"{z:.2f}")
+                for i, (x, y, z) in enumerate(self.weld_points.tolist())]
+        self.coord_table.tk.call(self._FILL_TABLE, self.coord_table._w, rows)
+    
+    def _append_coord_row(self, x, y, z):
+        """Add the row for the point just appended to weld_points"""
+        self.coord_table.insert('', 'end', values=(len(self.weld_points), f"{x:.2f}", f"{y:.2f}", f"{z:.2f}"))
     
     def delete_selected_point(self):
         """Delete selected point from table"""
@@ -615,15 +844,21 @@ class MainWindow:
         if selection:
             item = selection[0]
             index = self.coord_table.index(item)
-            self.weld_points.pop(index)
-            self.update_coord_table()
+            self._remove_weld_point(index)
+            
+            # Drop just that row; only the rows after it change number
+            self.coord_table.delete(item)
+            rows = self.coord_table.get_children()
+            for number in range(index, len(rows)):
+                self.coord_table.set(rows[number], 'P', number + 1)
+            
             self.update_weld_visualization()
             self.status_label.config(text="✓ Point deleted")
     
     def clear_all_points(self):
         """Clear all weld points"""
         if messagebox.askyesno("Confirm", "Clear all weld points?"):
-            self.weld_points.clear()
+            self._clear_weld_points()
             self.update_coord_table()
             self.update_weld_visualization()
             self.status_label.config(text="✓ All points cleared")
@@ -632,15 +867,10 @@ class MainWindow:
         """Update graph to show weld path and area"""
         # TODO: Add weld line visualization to graph
         # For now, just update total length
-        if len(self.weld_points) >= 2:
-            total_length = 0
-            for i in range(len(self.weld_points) - 1):
-                p1 = self.weld_points[i]
-                p2 = self.weld_points[i + 1]
-                dx = p2[0] - p1[0]
-                dy = p2[1] - p1[1]
-                dz = p2[2] - p1[2]
-                total_length += (dx**2 + dy**2 + dz**2) ** 0.5
+        points = self.weld_points
+        if len(points) >= 2:
+            # Sum of the segment lengths, all segments at once
+            total_length = float(np.linalg.norm(np.diff(points, axis=0), axis=1).sum())
             
             try:
                 rod_len = float(self.rod_length.get())
@@ -700,7 +930,7 @@ class MainWindow:
     def stop_welding(self):
         """Stop welding operation"""
         stop_command = generate_stop_command()
-        send_command_to_esp32(stop_command, priority=True)
+        self._send_stop(stop_command)
         self.status_label.config(text="✓ Welding stopped")
         messagebox.showinfo("Stopped", "Welding operation stopped.")
     
@@ -724,8 +954,13 @@ class MainWindow:
         """Emergency stop - halt all motion and welding"""
         print("!!! EMERGENCY STOP !!!")
         
+        # A debounced slider MOVE (or the release of a drag in progress)
+        # must not reach the ESP32 after the STOP
+        self._cancel_slider_flush()
+        self._dragging = None
+        
         stop_command = generate_stop_command()
-        send_command_to_esp32(stop_command, priority=True)
+        self._send_stop(stop_command)
         
         # Reset robot to safe position
         for link in self.robot.links:
@@ -745,11 +980,35 @@ class MainWindow:
         # Reset status color after 3 seconds
         self.root.after(3000, lambda: self.status_label.config(fg='#00ff00'))
     
+    def _preview_view(self):
+        """Move the drawn arm to the current pose, without a full redraw"""
+        # Only the arm's line is moved (axes limits stay as they are) and
+        # the canvas repaints when idle, so a fast drag costs one paint per
+        # idle loop. _rendered is left alone: the update_view() on release
+        # still does the full redraw
+        points = self.robot.get_points()
+        if self.view_mode.get() == "3D":
+            self.view_3d.draw_skeleton_only(points)
+        else:
+            self.view_2d.draw_skeleton_only(points)
+        
+        x, y, z = points[-1]
+        self.coord_label.config(text=f"X:{x:.2f} Y:{y:.2f} Z:{z:.2f}")
+    
     def update_view(self):
         """Update 2D/3D visualization"""
         points = self.robot.get_points()
         
-        if self.view_mode.get() == "3D":
+        # The model's pose version changes with every angle/length/axis
+        # edit, so an unchanged (version, mode) means the view already
+        # shows this pose - skip the redraw
+        mode = self.view_mode.get()
+        rendered = (self.robot.pose_version, mode)
+        if rendered == self._rendered:
+            return
+        self._rendered = rendered
+        
+        if mode == "3D":
             self.view_2d.canvas.get_tk_widget().pack_forget()
             self.view_3d.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
             self.view_3d.update(points)
@@ -11,12 +11,13 @@ class RobotView2D:
 
         self.canvas = FigureCanvasTkAgg(self.fig, master=parent)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self._line = None  # The arm's line from the last full update()
 
     def update(self, points):
         self.ax.clear()
         xs, ys, _ = zip(*points)
 
-        self.ax.plot(xs, ys, marker="o", linewidth=2, markersize=6)
+        self._line, = self.ax.plot(xs, ys, marker="o", linewidth=2, markersize=6)
         
         # Dynamic bounds with padding
         x_min, x_max = min(xs), max(xs)
@@ -35,3 +36,17 @@ class RobotView2D:
 
         self.canvas.draw()
 
+    def draw_skeleton_only(self, points):
+        """
+        Cheap redraw for previews (e.g. while a slider is dragged).
+
+        Moves the existing arm line to the new points and lets the canvas
+        redraw when idle - no axes clear, no new limits or grid. Call
+        update() for the full picture afterwards.
+        """
+        if self._line is None:
+            self.update(points)
+            return
+        xs, ys, _ = zip(*points)
+        self._line.set_data(xs, ys)
+        self.canvas.draw_idle()
@@ -11,12 +11,13 @@ class RobotView3D:
 
         self.canvas = FigureCanvasTkAgg(self.fig, master=parent)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self._line = None  # The arm's line from the last full update()
 
     def update(self, points):
         self.ax.clear()
         xs, ys, zs = zip(*points)
 
-        self.ax.plot(xs, ys, zs, marker="o", linewidth=2, markersize=6)
+        self._line, = self.ax.plot(xs, ys, zs, marker="o", linewidth=2, markersize=6)
         
         # Dynamic bounds with padding
         x_min, x_max = min(xs), max(xs)
@@ -42,3 +43,17 @@ class RobotView3D:
 
         self.canvas.draw()
 
+    def draw_skeleton_only(self, points):
+        """
+        Cheap redraw for previews (e.g. while a slider is dragged).
+
+        Moves the existing arm line to the new points and lets the canvas
+        redraw when idle - no axes clear, no new limits, labels or grid.
+        Call update() for the full picture afterwards.
+        """
+        if self._line is None:
+            self.update(points)
+            return
+        xs, ys, zs = zip(*points)
+        self._line.set_data_3d(xs, ys, zs)
+        self.canvas.draw_idle()
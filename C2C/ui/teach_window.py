@@ -7,14 +7,14 @@ import threading
 
 # Import command generation modules
 try:
-    from ..robot.command_builder import generate_move_command, generate_stop_command, format_command_for_display
+    from ..robot.command_builder import generate_move_command, generate_stop_command, format_command_for_display, as_str
     from ..hardware.esp32_comm import send_command_to_esp32
 except ImportError:
     try:
-        from C2C.robot.command_builder import generate_move_command, generate_stop_command, format_command_for_display
+        from C2C.robot.command_builder import generate_move_command, generate_stop_command, format_command_for_display, as_str
         from C2C.hardware.esp32_comm import send_command_to_esp32
     except ImportError:
-        from robot.command_builder import generate_move_command, generate_stop_command, format_command_for_display
+        from robot.command_builder import generate_move_command, generate_stop_command, format_command_for_display, as_str
         from hardware.esp32_comm import send_command_to_esp32
 
 
@@ -324,11 +324,11 @@ class TeachWindow:
                 self.sliders[index]['entry'].insert(0, f"{float(value):.1f}")
             
             # Generate and send command to ESP32
-            command = generate_move_command(self.robot, speed=30, time_ms=100)
-            if command:
-                send_command_to_esp32(command)
+            frame = generate_move_command(self.robot, speed=30, time_ms=100, return_struct=True)
+            if frame:
+                send_command_to_esp32(frame.wire)
                 print(f"📤 Command generated:")
-                print(format_command_for_display(command))
+                print(format_command_for_display(frame))
             
             # Record if teaching
             if self.is_teaching:
@@ -492,16 +492,18 @@ class TeachWindow:
                     time.sleep(wait_time)
                 
                 # Set angles
+                links = self.robot.links
+                count = len(links)
                 for joint_idx, angle in angles.items():
-                    if joint_idx < len(self.robot.links):
-                        self.robot.links[joint_idx].angle = angle
+                    if joint_idx < count:
+                        links[joint_idx].angle = angle
                 
                 # Generate and send command to ESP32
-                command = generate_move_command(self.robot, speed=30, time_ms=100)
-                if command:
-                    send_command_to_esp32(command)
+                frame = generate_move_command(self.robot, speed=30, time_ms=100, return_struct=True)
+                if frame:
+                    send_command_to_esp32(frame.wire)
                     print(f"📤 Repeat Command:")
-                    print(format_command_for_display(command))
+                    print(format_command_for_display(frame))
                 
                 # Update UI
                 self.window.after(0, self._sync_sliders_from_robot)
@@ -543,7 +545,7 @@ class TeachWindow:
         # Send STOP command to ESP32 immediately (priority)
         stop_command = generate_stop_command()
         send_command_to_esp32(stop_command, priority=True)
-        print(f"📤 EMERGENCY STOP Command sent: {stop_command}")
+        print(f"📤 EMERGENCY STOP Command sent: {as_str(stop_command)}")
         
         # Stop all operations
         self.is_teaching = False